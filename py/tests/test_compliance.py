@@ -0,0 +1,62 @@
+"""Tests for the compliance suite's own fixture handling."""
+
+from yggdrasil import compliance
+from yggdrasil.types import Capabilities
+
+
+class _Caps:
+    def __init__(self, caps):
+        self._caps = caps
+
+    def capabilities(self):
+        return self._caps
+
+    def system_id(self):
+        return "caps"
+
+    def system_type(self):
+        return "caps"
+
+
+def _fixture(caps):
+    return {"create_system": lambda: _Caps(caps), "close": lambda sys: None}
+
+
+class TestSkipReason:
+    def test_capability_mask_is_per_fixture(self):
+        needs_branches = compliance.test_branch_isolation
+        for _ in range(20):
+            # a dropped fixture frees its id for the next dict to reuse
+            fix = _fixture(Capabilities(snapshotable=True, branchable=True))
+            assert compliance.skip_reason(fix, needs_branches) is None
+            del fix
+            fix = _fixture(Capabilities(snapshotable=True))
+            assert compliance.skip_reason(fix, needs_branches) is not None
+
+    def test_mask_computed_once(self):
+        created = []
+        fix = _fixture(Capabilities(snapshotable=True))
+        create = fix["create_system"]
+        fix["create_system"] = lambda: created.append(1) or create()
+        compliance.skip_reason(fix, compliance.test_branch_isolation)
+        compliance.skip_reason(fix, compliance.test_branch_isolation)
+        assert len(created) == 1
+
+
+class TestPooledSystems:
+    def test_identity_uses_pool_when_provided(self):
+        events = []
+        fix = _fixture(Capabilities(snapshotable=True))
+        fix["acquire_pooled"] = lambda: events.append("acquire") or _Caps(
+            Capabilities(snapshotable=True))
+        fix["release_pooled"] = lambda sys: events.append("release")
+        fix["close"] = lambda sys: events.append("close")
+        compliance.test_system_identity(fix)
+        assert events == ["acquire", "release"]
+
+    def test_identity_falls_back_to_create_and_close(self):
+        events = []
+        fix = _fixture(Capabilities(snapshotable=True))
+        fix["close"] = lambda sys: events.append("close")
+        compliance.test_system_identity(fix)
+        assert events == ["close"]
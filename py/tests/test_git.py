@@ -1,19 +1,27 @@
 """Compliance tests for the Git adapter.
 
 Tests the GitSystem adapter against the full Yggdrasil compliance suite.
-Requires git to be installed.
+Requires git to be installed. Each test works in its own repo, so the
+suite can run in parallel with pytest-xdist (`pytest -n auto`).
 """
 
+import asyncio
+import gc
 import os
 import subprocess
 import tempfile
 import shutil
+import signal
 import uuid
 
 import pytest
 
+from yggdrasil.adapters import git as git_adapter
 from yggdrasil.adapters.git import GitSystem, create
-from yggdrasil.compliance import run_compliance_tests, ALL_TESTS
+from yggdrasil.protocols import Graphable
+# Imported as a module: binding the compliance test_* functions into this
+# namespace would make pytest collect them directly.
+from yggdrasil import compliance
 
 
 # ============================================================
@@ -33,33 +41,82 @@ def _git(repo: str, *args: str) -> str:
     return result.stdout.strip()
 
 
+# One shell invocation instead of a git spawn per setup step.
+_INIT_SCRIPT = (
+    f"mkdir -p {DATA_DIR} && : > {DATA_DIR}/.gitkeep"
+    " && git init -q -b main"
+    " && git config user.email test@yggdrasil.dev"
+    " && git config user.name 'Yggdrasil Test'"
+    " && git add -A"
+    " && git commit -q -m init"
+)
+
+
 def _init_repo() -> str:
     """Create a temporary git repo with an initial empty commit on 'main'."""
     tmp = tempfile.mkdtemp(prefix="ygg-test-git-")
-    _git(tmp, "init", "-b", "main")
-    _git(tmp, "config", "user.email", "test@yggdrasil.dev")
-    _git(tmp, "config", "user.name", "Yggdrasil Test")
-    # Create data dir with .gitkeep so it's tracked
-    os.makedirs(os.path.join(tmp, DATA_DIR))
-    gitkeep = os.path.join(tmp, DATA_DIR, ".gitkeep")
-    open(gitkeep, "w").close()
-    _git(tmp, "add", "-A")
-    _git(tmp, "commit", "-m", "init")
+    subprocess.run(["sh", "-c", _INIT_SCRIPT], cwd=tmp, check=True,
+                   stdout=subprocess.DEVNULL)
     return tmp
 
 
-def _create_system() -> GitSystem:
-    repo = _init_repo()
+# Initialised repo shared by the session; each test gets a copy of it that
+# borrows the template's object store through objects/info/alternates.
+_TEMPLATE = None
+
+
+# Seeded repos built by _create_seeded, keyed by (entries, msg).
+_SEEDED = {}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _git_template():
+    """Run _init_repo once per session instead of once per system."""
+    global _TEMPLATE
+    _TEMPLATE = _init_repo()
+    yield _TEMPLATE
+    for path in [_TEMPLATE, *_SEEDED.values()]:
+        shutil.rmtree(path, ignore_errors=True)
+    _SEEDED.clear()
+    _TEMPLATE = None
+
+
+def _clone_template(template: str) -> GitSystem:
+    """Copy template into a fresh repo that borrows its object store."""
+    template_objects = os.path.join(template, ".git", "objects")
+
+    def skip_objects(path, names):
+        return names if path == template_objects else ()
+
+    repo = tempfile.mkdtemp(prefix="ygg-test-git-")
+    shutil.copytree(template, repo, symlinks=True, dirs_exist_ok=True,
+                    ignore=skip_objects)
+    objects = os.path.join(repo, ".git", "objects")
+    os.makedirs(os.path.join(objects, "info"))
+    os.makedirs(os.path.join(objects, "pack"))
+    with open(os.path.join(objects, "info", "alternates"), "w") as f:
+        f.write(template_objects + "\n")
     return create(repo)
 
 
-def _mutate(sys: GitSystem) -> GitSystem:
-    """Create a unique file in the repo to make it dirty."""
+def _create_system() -> GitSystem:
+    if _TEMPLATE is None:
+        return create(_init_repo())
+    return _clone_template(_TEMPLATE)
+
+
+def _write_mutation(sys: GitSystem) -> str:
+    """Create a unique file in the repo and return its name."""
     fname = f"_mut_{uuid.uuid4().hex[:8]}.txt"
     fpath = os.path.join(sys.repo_path, fname)
     with open(fpath, "w") as f:
         f.write(f"mutation {uuid.uuid4()}\n")
-    _git(sys.repo_path, "add", fname)
+    return fname
+
+
+def _mutate(sys: GitSystem) -> GitSystem:
+    """Create a unique file in the repo to make it dirty."""
+    _git(sys.repo_path, "add", _write_mutation(sys))
     return sys
 
 
@@ -72,190 +129,628 @@ def _commit(sys: GitSystem, msg: str) -> GitSystem:
     except RuntimeError as e:
         if "nothing to commit" not in str(e):
             raise
+    sys.invalidate()
+    return sys
+
+
+_MUTATE_COMMIT_SCRIPT = 'git add -A && git commit -q --allow-empty-message -m "$1"'
+
+
+def _mutate_commit(sys: GitSystem, msg: str) -> GitSystem:
+    """_mutate followed by _commit, staged and committed in one shell call."""
+    _write_mutation(sys)
+    subprocess.run(["sh", "-c", _MUTATE_COMMIT_SCRIPT, "_", msg],
+                   cwd=sys.repo_path, check=True)
+    sys.invalidate()
     return sys
 
 
 def _close(sys: GitSystem) -> None:
-    """Remove the temporary repo."""
-    if os.path.exists(sys.repo_path):
-        shutil.rmtree(sys.repo_path)
+    """Stop the adapter's git processes and remove the temporary repo."""
+    sys.close()
+    shutil.rmtree(sys.repo_path, ignore_errors=True)
 
 
 def _write_entry(sys: GitSystem, key: str, value: str) -> GitSystem:
     """Write a file in data/ directory with key as filename."""
+    return _write_entries(sys, [(key, value)])
+
+
+def _write_entries(sys: GitSystem, entries) -> GitSystem:
+    """Write (key, value) pairs into data/ and stage them with one git call."""
     data_path = os.path.join(sys.repo_path, DATA_DIR)
     os.makedirs(data_path, exist_ok=True)
-    fpath = os.path.join(data_path, key)
-    with open(fpath, "w") as f:
-        f.write(value)
-    _git(sys.repo_path, "add", os.path.join(DATA_DIR, key))
+    paths = []
+    for key, value in entries:
+        with open(os.path.join(data_path, key), "w") as f:
+            f.write(value)
+        paths.append(os.path.join(DATA_DIR, key))
+    if paths:
+        _git(sys.repo_path, "add", "--", *paths)
     return sys
 
 
 def _read_entry(sys: GitSystem, key: str) -> str:
     """Read a file from data/ directory, or None if not exists."""
-    fpath = os.path.join(sys.repo_path, DATA_DIR, key)
-    if not os.path.exists(fpath):
+    try:
+        with open(os.path.join(sys.repo_path, DATA_DIR, key), "r") as f:
+            return f.read()
+    except FileNotFoundError:
         return None
-    with open(fpath, "r") as f:
-        return f.read()
 
 
 def _count_entries(sys: GitSystem) -> int:
     """Count files in the data/ directory (excluding .gitkeep)."""
-    data_path = os.path.join(sys.repo_path, DATA_DIR)
-    if not os.path.exists(data_path):
+    try:
+        with os.scandir(os.path.join(sys.repo_path, DATA_DIR)) as it:
+            return sum(1 for e in it
+                       if e.name != ".gitkeep" and e.is_file(follow_symlinks=False))
+    except FileNotFoundError:
         return 0
-    return len([f for f in os.listdir(data_path)
-                if os.path.isfile(os.path.join(data_path, f)) and f != ".gitkeep"])
 
 
 def _delete_entry(sys: GitSystem, key: str) -> GitSystem:
     """Delete a file from data/ directory."""
-    fpath = os.path.join(sys.repo_path, DATA_DIR, key)
-    if os.path.exists(fpath):
-        _git(sys.repo_path, "rm", "-f", os.path.join(DATA_DIR, key))
+    _git(sys.repo_path, "rm", "-f", "--ignore-unmatch", "--", os.path.join(DATA_DIR, key))
     return sys
 
 
+def _create_seeded(entries, msg: str) -> GitSystem:
+    """Fresh system with entries committed as msg.
+
+    Each distinct seed is built once per session and then copied like the
+    base template.
+    """
+    if _TEMPLATE is None:
+        return _commit(_write_entries(_create_system(), entries), msg)
+    key = (tuple(entries), msg)
+    if key not in _SEEDED:
+        seed = _commit(_write_entries(_create_system(), entries), msg)
+        seed.close()
+        _SEEDED[key] = seed.repo_path
+    return _clone_template(_SEEDED[key])
+
+
 GIT_FIXTURE = {
     "create_system": _create_system,
     "mutate": _mutate,
     "commit": _commit,
+    "mutate_commit": _mutate_commit,
     "close": _close,
     "write_entry": _write_entry,
+    "write_entries": _write_entries,
     "read_entry": _read_entry,
     "count_entries": _count_entries,
     "delete_entry": _delete_entry,
+    "create_seeded": _create_seeded,
 }
 
 
 # ============================================================
-# Individual test functions (pytest discovers these)
+# Compliance suite, one pytest case per compliance test
 # ============================================================
 
-class TestGitSystemIdentity:
-    def test_system_identity(self):
-        from yggdrasil.compliance import test_system_identity
-        test_system_identity(GIT_FIXTURE)
-
-
-class TestGitSnapshotable:
-    def test_snapshot_id_after_commit(self):
-        from yggdrasil.compliance import test_snapshot_id_after_commit
-        test_snapshot_id_after_commit(GIT_FIXTURE)
-
-    def test_parent_ids_root_commit(self):
-        from yggdrasil.compliance import test_parent_ids_root_commit
-        test_parent_ids_root_commit(GIT_FIXTURE)
-
-    def test_parent_ids_chain(self):
-        from yggdrasil.compliance import test_parent_ids_chain
-        test_parent_ids_chain(GIT_FIXTURE)
-
-    def test_snapshot_meta(self):
-        from yggdrasil.compliance import test_snapshot_meta
-        test_snapshot_meta(GIT_FIXTURE)
-
-    def test_as_of(self):
-        from yggdrasil.compliance import test_as_of
-        test_as_of(GIT_FIXTURE)
-
-
-class TestGitBranchable:
-    def test_initial_branches(self):
-        from yggdrasil.compliance import test_initial_branches
-        test_initial_branches(GIT_FIXTURE)
-
-    def test_create_branch(self):
-        from yggdrasil.compliance import test_create_branch
-        test_create_branch(GIT_FIXTURE)
-
-    def test_checkout(self):
-        from yggdrasil.compliance import test_checkout
-        test_checkout(GIT_FIXTURE)
-
-    def test_branch_isolation(self):
-        from yggdrasil.compliance import test_branch_isolation
-        test_branch_isolation(GIT_FIXTURE)
-
-    def test_delete_branch(self):
-        from yggdrasil.compliance import test_delete_branch
-        test_delete_branch(GIT_FIXTURE)
-
-
-class TestGitGraphable:
-    def test_history(self):
-        from yggdrasil.compliance import test_history
-        test_history(GIT_FIXTURE)
-
-    def test_history_limit(self):
-        from yggdrasil.compliance import test_history_limit
-        test_history_limit(GIT_FIXTURE)
-
-    def test_ancestors(self):
-        from yggdrasil.compliance import test_ancestors
-        test_ancestors(GIT_FIXTURE)
-
-    def test_ancestor_predicate(self):
-        from yggdrasil.compliance import test_ancestor_predicate
-        test_ancestor_predicate(GIT_FIXTURE)
-
-    def test_common_ancestor(self):
-        from yggdrasil.compliance import test_common_ancestor
-        test_common_ancestor(GIT_FIXTURE)
-
-    def test_commit_info(self):
-        from yggdrasil.compliance import test_commit_info
-        test_commit_info(GIT_FIXTURE)
-
-
-class TestGitMergeable:
-    def test_merge(self):
-        from yggdrasil.compliance import test_merge
-        test_merge(GIT_FIXTURE)
-
-    def test_merge_parent_ids(self):
-        from yggdrasil.compliance import test_merge_parent_ids
-        test_merge_parent_ids(GIT_FIXTURE)
-
-    def test_conflicts_empty_for_compatible(self):
-        from yggdrasil.compliance import test_conflicts_empty_for_compatible
-        test_conflicts_empty_for_compatible(GIT_FIXTURE)
-
-    def test_diff(self):
-        from yggdrasil.compliance import test_diff
-        test_diff(GIT_FIXTURE)
-
-
-class TestGitDataConsistency:
-    def test_write_read_roundtrip(self):
-        from yggdrasil.compliance import test_write_read_roundtrip
-        test_write_read_roundtrip(GIT_FIXTURE)
-
-    def test_count_after_writes(self):
-        from yggdrasil.compliance import test_count_after_writes
-        test_count_after_writes(GIT_FIXTURE)
-
-    def test_multiple_entries_readable(self):
-        from yggdrasil.compliance import test_multiple_entries_readable
-        test_multiple_entries_readable(GIT_FIXTURE)
-
-    def test_branch_data_isolation(self):
-        from yggdrasil.compliance import test_branch_data_isolation
-        test_branch_data_isolation(GIT_FIXTURE)
-
-    def test_delete_entry_consistency(self):
-        from yggdrasil.compliance import test_delete_entry_consistency
-        test_delete_entry_consistency(GIT_FIXTURE)
-
-    def test_overwrite_entry(self):
-        from yggdrasil.compliance import test_overwrite_entry
-        test_overwrite_entry(GIT_FIXTURE)
+pytest_generate_tests = compliance.make_pytest_generate_tests(GIT_FIXTURE)
+
+
+@pytest.fixture
+def git_fixture():
+    return GIT_FIXTURE
+
+
+@pytest.fixture(scope="module")
+def shared_sys():
+    """One system for the module's read-only compliance tests."""
+    sys = _create_system()
+    yield sys
+    _close(sys)
+
+
+def test_compliance(request, git_fixture, test_fn):
+    if getattr(test_fn, "read_only", False):
+        git_fixture = compliance.with_shared_system(
+            git_fixture, request.getfixturevalue("shared_sys"))
+    test_fn(git_fixture)
+
+
+class TestGitBatch:
+    def test_close_stops_processes(self):
+        sys = _create_system()
+        try:
+            sys.snapshot_id()
+            sys.parent_ids()
+            procs = [sys._check._proc, sys._cat._proc]
+            sys.close()
+            assert all(p.poll() is not None for p in procs)
+            sys.close()  # idempotent
+            sys.invalidate()
+            assert len(sys.snapshot_id()) == 40  # reopened on demand
+        finally:
+            _close(sys)
+
+    def test_context_manager_closes(self):
+        sys = _create_system()
+        try:
+            with sys as entered:
+                assert entered is sys
+                sys.snapshot_id()
+                proc = sys._check._proc
+            assert proc.poll() is not None
+        finally:
+            _close(sys)
+
+    def test_dropped_system_stops_processes(self):
+        sys = _create_system()
+        repo = sys.repo_path
+        try:
+            sys.snapshot_id()
+            sys.parent_ids()
+            procs = [sys._check._proc, sys._cat._proc]
+            del sys
+            gc.collect()
+            assert all(p.poll() is not None for p in procs)
+            assert all(p.stdin.closed and p.stdout.closed for p in procs)
+        finally:
+            shutil.rmtree(repo, ignore_errors=True)
+
+    def test_restarts_after_child_dies(self):
+        sys = _create_system()
+        try:
+            head = sys.snapshot_id()
+            proc = sys._check._proc
+            proc.kill()
+            proc.wait()
+            sys.invalidate()
+            assert sys.snapshot_id() == head
+            assert sys._check._proc is not proc
+        finally:
+            _close(sys)
+
+    def test_interrupted_query_resyncs(self):
+        sys = _create_system()
+        try:
+            head = sys.snapshot_id()
+            sys.parent_ids()
+            proc = sys._cat._proc
+
+            class Interrupting:
+                """stdout that dies after the header, leaving the body unread."""
+                def __init__(self, real):
+                    self._real = real
+
+                def read(self, n):
+                    raise KeyboardInterrupt
+
+                def __getattr__(self, name):
+                    return getattr(self._real, name)
+
+            proc.stdout = Interrupting(proc.stdout)
+            with pytest.raises(KeyboardInterrupt):
+                sys._cat.query(head)
+            assert proc.poll() is not None and sys._cat._proc is None
+            header, raw = sys._cat.query(f"{head}^{{tree}}")
+            assert header.split()[1] == "tree"
+            assert sys.snapshot_meta(head)["snapshot-id"] == head
+        finally:
+            _close(sys)
+
+    def test_missing_object(self):
+        sys = _create_system()
+        try:
+            assert sys._cat.query("0" * 40) is None
+            assert sys._check.query("no-such-branch") is None
+            assert sys.parent_ids("0" * 40) == set()
+            with pytest.raises(ValueError):
+                sys._check.query("HEAD\nHEAD")
+            assert sys._check.query("HEAD") is not None  # channel still in sync
+        finally:
+            _close(sys)
+
+
+class TestGitSpawn:
+    @pytest.mark.skipif(not getattr(subprocess, "_USE_POSIX_SPAWN", False),
+                        reason="platform has no posix_spawn fast path")
+    def test_one_shot_calls_use_posix_spawn(self, monkeypatch):
+        sys = _create_system()
+        try:
+            calls = []
+            real = os.posix_spawn
+            monkeypatch.setattr(os, "posix_spawn",
+                                lambda *a, **kw: calls.append(a[0]) or real(*a, **kw))
+            sys.history()
+            assert calls and os.path.isabs(calls[0])
+        finally:
+            _close(sys)
+
+    def test_children_get_default_signal_handling(self):
+        # Python ignores SIGPIPE and SIGXFSZ; git's hooks must not inherit that
+        sys = _create_system()
+        try:
+            code, out, _err = git_adapter._spawn(
+                sys._argv, ("-c", "alias.sigs=!grep SigIgn /proc/self/status", "sigs"))
+            if code != 0 or not out:
+                pytest.skip("no /proc/self/status")
+            ignored = int(out.split()[-1], 16)
+            assert not ignored & (1 << (signal.SIGXFSZ - 1))
+        finally:
+            _close(sys)
+
+
+class TestGitRefsFromDisk:
+    def test_packed_and_nested_branches(self):
+        sys = _create_system()
+        try:
+            sys.branch("feature/x")
+            sys.branch("loose")
+            _git(sys.repo_path, "pack-refs", "--all")
+            sys.branch("after-pack")
+            assert not os.path.exists(
+                os.path.join(sys.repo_path, ".git", "refs", "heads", "feature", "x"))
+            expected = {"main", "feature/x", "loose", "after-pack"}
+            assert sys.branches() == expected
+            assert sys._read_branches_fs() == expected
+            sys.checkout("feature/x")
+            assert sys.current_branch() == "feature/x"
+        finally:
+            _close(sys)
+
+    def test_detached_head(self):
+        sys = _create_system()
+        try:
+            _git(sys.repo_path, "checkout", "-q", "--detach")
+            sys.invalidate()
+            assert sys.current_branch() == "HEAD"
+        finally:
+            _close(sys)
+
+    def test_linked_worktree(self):
+        sys = _create_system()
+        wt = tempfile.mkdtemp(prefix="ygg-test-git-wt-")
+        try:
+            sys.branch("side")
+            _git(sys.repo_path, "worktree", "add", "-q", wt, "side")
+            with create(wt) as linked:
+                assert os.path.isfile(os.path.join(wt, ".git"))
+                assert linked._read_branches_fs() == {"main", "side"}
+                assert linked.current_branch() == "side"
+        finally:
+            _close(sys)
+            shutil.rmtree(wt, ignore_errors=True)
+
+    def test_falls_back_to_git_without_git_dir(self):
+        sys = _create_system()
+        try:
+            sys.branch("other")
+            with create(os.path.join(sys.repo_path, DATA_DIR)) as sub:
+                sub._dirs = ()  # as if rev-parse couldn't resolve it
+                assert sub._read_branches_fs() is None
+                assert sub.branches() == {"main", "other"}
+                assert sub.current_branch() == "main"
+        finally:
+            _close(sys)
+
+    def test_reftable_layout_falls_back(self):
+        # What a reftable repo looks like on disk, for gits that can't make one.
+        sys = _create_system()
+        stub = tempfile.mkdtemp(prefix="ygg-test-git-stub-")
+        try:
+            with open(os.path.join(stub, "HEAD"), "w") as f:
+                f.write("ref: refs/heads/.invalid\n")
+            os.makedirs(os.path.join(stub, "refs", "heads"))
+            os.makedirs(os.path.join(stub, "reftable"))
+            sys._dirs = (stub, stub)
+            assert sys._read_branches_fs() is None
+            assert sys.branches() == {"main"}
+            assert sys.current_branch() == "main"
+        finally:
+            _close(sys)
+            shutil.rmtree(stub, ignore_errors=True)
+
+    def test_reftable(self):
+        repo = tempfile.mkdtemp(prefix="ygg-test-git-")
+        try:
+            if subprocess.run(["git", "init", "-q", "-b", "main", "--ref-format=reftable", repo],
+                              capture_output=True).returncode != 0:
+                pytest.skip("git without reftable support")
+            _git(repo, "-c", "user.name=t", "-c", "user.email=t@t",
+                 "commit", "-q", "--allow-empty", "-m", "init")
+            _git(repo, "branch", "other")
+            with create(repo) as sys:
+                assert sys._read_branches_fs() is None
+                assert sys.branches() == {"main", "other"}
+                assert sys.current_branch() == "main"
+        finally:
+            shutil.rmtree(repo, ignore_errors=True)
+
+
+class TestGitHeadCache:
+    def test_sees_external_commit(self):
+        sys = _create_system()
+        try:
+            before = sys.snapshot_id()
+            other = create(sys.repo_path)
+            _commit(_mutate(other), "from another system")
+            other.close()
+            assert sys.snapshot_id() != before
+            assert sys.snapshot_id() == _git(sys.repo_path, "rev-parse", "HEAD")
+        finally:
+            _close(sys)
+
+    def test_sees_external_checkout(self):
+        sys = _create_system()
+        try:
+            assert sys.current_branch() == "main"
+            _git(sys.repo_path, "checkout", "-q", "-b", "elsewhere")
+            _git(sys.repo_path, "commit", "-q", "--allow-empty", "-m", "moved")
+            assert sys.current_branch() == "elsewhere"
+            assert sys.snapshot_id() == _git(sys.repo_path, "rev-parse", "HEAD")
+        finally:
+            _close(sys)
+
+    def test_own_mutators_refresh(self):
+        sys = _create_system()
+        try:
+            base = sys.snapshot_id()
+            sys = _commit(_mutate(sys), "on main")
+            main_head = sys.snapshot_id()
+            assert main_head != base
+            sys.branch("feature", base)
+            assert sys.current_branch() == "main"
+            sys.checkout("feature")
+            assert (sys.current_branch(), sys.snapshot_id()) == ("feature", base)
+            sys = _commit(_mutate(sys), "on feature")
+            feat_head = sys.snapshot_id()
+            sys.checkout("main")
+            assert sys.snapshot_id() == main_head
+            sys.merge("feature", message="merge feature")
+            assert sys.parent_ids() == {main_head, feat_head}
+        finally:
+            _close(sys)
+
+    def test_subdirectory_sees_external_commit(self):
+        sys = _create_system()
+        try:
+            with create(os.path.join(sys.repo_path, DATA_DIR)) as sub:
+                assert sub._git_dirs()[0] == os.path.realpath(
+                    os.path.join(sys.repo_path, ".git"))
+                before = sub.snapshot_id()
+                _git(sys.repo_path, "commit", "-q", "--allow-empty", "-m", "external")
+                assert sub.snapshot_id() != before
+        finally:
+            _close(sys)
+
+    def test_bare_repo_sees_push(self):
+        sys = _create_system()
+        bare = tempfile.mkdtemp(prefix="ygg-test-git-bare-")
+        try:
+            _git(sys.repo_path, "clone", "-q", "--bare", sys.repo_path, bare)
+            with create(bare) as remote:
+                assert remote._git_dirs() == (bare, bare)
+                before = remote.snapshot_id()
+                sys = _commit(_mutate(sys), "pushed")
+                _git(sys.repo_path, "push", "-q", bare, "main")
+                assert remote.snapshot_id() == sys.snapshot_id() != before
+                assert remote.current_branch() == "main"
+        finally:
+            _close(sys)
+            shutil.rmtree(bare, ignore_errors=True)
+
+    def test_no_stamp_no_cache(self):
+        sys = _create_system()
+        try:
+            before = sys.snapshot_id()
+            sys._dirs = ()  # as for reftable: nothing to stat
+            _git(sys.repo_path, "commit", "-q", "--allow-empty", "-m", "external")
+            assert sys.snapshot_id() != before
+            _git(sys.repo_path, "checkout", "-q", "-b", "moved")
+            assert sys.current_branch() == "moved"
+        finally:
+            _close(sys)
+
+
+class TestGitCommitCache:
+    def test_evicts_least_recently_used(self, monkeypatch):
+        monkeypatch.setattr(git_adapter, "_COMMIT_CACHE_SIZE", 2)
+        sys = _create_system()
+        try:
+            ids = []
+            for i in range(3):
+                sys = _commit(_mutate(sys), f"commit {i}")
+                ids.append(sys.snapshot_id())
+            sys.snapshot_meta(ids[0])
+            sys.snapshot_meta(ids[1])
+            sys.snapshot_meta(ids[0])  # hit: ids[0] becomes most recent
+            sys.snapshot_meta(ids[2])  # evicts ids[1], not ids[0]
+            assert list(sys._commits) == [ids[0], ids[2]]
+        finally:
+            _close(sys)
+
+
+class TestGitAncestryCache:
+    def _two_commits(self):
+        sys = _create_system()
+        a = sys.snapshot_id()
+        sys = _commit(_mutate(sys), "second")
+        return sys, a, sys.snapshot_id()
+
+    def _count_spawns(self, monkeypatch):
+        spawns = []
+        real = git_adapter._spawn
+        monkeypatch.setattr(git_adapter, "_spawn",
+                            lambda *args, **kw: spawns.append(args) or real(*args, **kw))
+        return spawns
+
+    def test_full_shas_cached(self, monkeypatch):
+        sys, a, b = self._two_commits()
+        try:
+            assert sys.is_ancestor(a, b) and not sys.is_ancestor(b, a)
+            assert sys.common_ancestor(a, b) == a
+            spawns = self._count_spawns(monkeypatch)
+            assert sys.is_ancestor(a, b) and not sys.is_ancestor(b, a)
+            assert sys.common_ancestor(a, b) == a
+            assert spawns == []
+        finally:
+            _close(sys)
+
+    def test_short_refs_not_cached(self, monkeypatch):
+        sys, a, b = self._two_commits()
+        try:
+            spawns = self._count_spawns(monkeypatch)
+            for _ in range(2):
+                assert sys.is_ancestor(a[:10], "main")
+                assert sys.common_ancestor(a, "HEAD") == a
+            assert len(spawns) == 4
+            assert not sys._is_anc and not sys._merge_base
+        finally:
+            _close(sys)
+
+    def test_bounded(self, monkeypatch):
+        monkeypatch.setattr(git_adapter, "_ANCESTRY_CACHE_SIZE", 1)
+        sys, a, b = self._two_commits()
+        try:
+            sys.is_ancestor(a, b)
+            sys.is_ancestor(b, a)
+            sys.common_ancestor(a, b)
+            sys.common_ancestor(b, a)
+            assert list(sys._is_anc) == [(b, a)]
+            assert list(sys._merge_base) == [(b, a)]
+        finally:
+            _close(sys)
+
+
+class TestGitSnapshotMeta:
+    def test_multiline_message(self):
+        sys = _create_system()
+        try:
+            sys = _commit(_mutate(sys), "subject\n\nbody line 1\nbody line 2")
+            meta = sys.snapshot_meta(sys.snapshot_id())
+            assert meta["message"] == "subject\n\nbody line 1\nbody line 2"
+            assert meta["author"] == "Yggdrasil Test <test@yggdrasil.dev>"
+        finally:
+            _close(sys)
+
+    def test_snapshot_meta_many(self):
+        sys = _create_system()
+        try:
+            ids = []
+            for i in range(3):
+                sys = _commit(_mutate(sys), f"commit {i}\n\ndetails {i}")
+                ids.append(sys.snapshot_id())
+            fresh = create(sys.repo_path)
+            try:
+                metas = fresh.snapshot_meta_many(ids + ["HEAD"])
+                assert set(metas) == set(ids)
+                for sid in ids:
+                    assert metas[sid] == sys.snapshot_meta(sid)
+            finally:
+                fresh.close()
+            assert sys.snapshot_meta_many([]) == {}
+        finally:
+            _close(sys)
+
+
+class TestGitAncestorsIter:
+    def test_streams_in_rev_list_order(self):
+        sys = _create_system()
+        try:
+            ids = []
+            for i in range(3):
+                sys = _commit(_mutate(sys), f"commit {i}")
+                ids.append(sys.snapshot_id())
+            base = _git(sys.repo_path, "rev-list", "--max-parents=0", "HEAD")
+            assert list(sys.ancestors_iter(ids[-1])) == ids[-2::-1] + [base]
+            assert list(sys.ancestors_iter(ids[-1], limit=1)) == [ids[-2]]
+            assert sys.ancestors(ids[-1]) == ids[-2::-1] + [base]
+            assert sys.ancestors(base) == []
+        finally:
+            _close(sys)
+
+    def test_matches_protocol_default(self):
+        sys = _create_system()
+        try:
+            base = sys.snapshot_id()
+            sys.branch("side")
+            sys = _commit(_mutate(sys), "main")
+            sys.checkout("side")
+            sys = _commit(_mutate(sys), "side")
+            sys.checkout("main")
+            sys.merge("side", message="merge")
+            head = sys.snapshot_id()
+            default = Graphable.ancestors(sys, head)
+            assert head not in default and base in default
+            assert sorted(sys.ancestors(head)) == sorted(default)
+        finally:
+            _close(sys)
+
+    def test_early_break(self):
+        sys = _create_system()
+        try:
+            first = sys.snapshot_id()
+            sys = _commit(_mutate(_commit(_mutate(sys), "first")), "second")
+            it = sys.ancestors_iter(sys.snapshot_id())
+            next(it)
+            assert next(it) == first
+            it.close()
+        finally:
+            _close(sys)
+
+    def test_unknown_revision(self):
+        sys = _create_system()
+        try:
+            with pytest.raises(RuntimeError):
+                list(sys.ancestors_iter("no-such-rev"))
+        finally:
+            _close(sys)
+
+
+class TestGitAsync:
+    def test_async_companions(self):
+        sys = _create_system()
+        try:
+            sys = _commit(_mutate(sys), "first")
+            head = sys.snapshot_id()
+
+            async def run():
+                await sys.branch_async("feature")
+                assert await sys.branches_async() == {"main", "feature"}
+                await sys.checkout_async("feature")
+                assert sys.current_branch() == "feature"
+                assert await sys.history_async(limit=1) == [head]
+                assert await sys.common_ancestor_async(head, head) == head
+                meta = await sys.snapshot_meta_async(head)
+                assert meta["message"] == "first"
+
+            asyncio.run(run())
+        finally:
+            _close(sys)
+
+
+class TestGitConcurrentAsync:
+    def test_gathered_calls_on_one_system(self, monkeypatch):
+        monkeypatch.setattr(git_adapter, "_COMMIT_CACHE_SIZE", 2)
+        sys = _create_system()
+        try:
+            ids = [sys.snapshot_id()]
+            for i in range(4):
+                sys = _commit(_mutate(sys), f"commit {i}")
+                ids.append(sys.snapshot_id())
+            expected = [sys.snapshot_meta(sid) for sid in ids]
+
+            async def run():
+                metas = asyncio.gather(*[sys.snapshot_meta_async(sid)
+                                         for sid in ids * 10])
+                heads = asyncio.gather(*[sys.history_async(limit=1) for _ in range(10)])
+                return await metas, await heads
+
+            metas, heads = asyncio.run(run())
+            assert metas == expected * 10
+            assert heads == [[ids[-1]]] * 10
+        finally:
+            _close(sys)
 
 
 class TestGitFullSuite:
     """Run all compliance tests as a single mega-test."""
 
     def test_run_all(self):
-        run_compliance_tests(GIT_FIXTURE)
+        compliance.run_compliance_tests(GIT_FIXTURE)
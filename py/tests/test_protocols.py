@@ -0,0 +1,76 @@
+"""Tests for the default method implementations on the protocol ABCs."""
+
+import asyncio
+import inspect
+
+import pytest
+
+from yggdrasil import protocols
+from yggdrasil.protocols import Snapshotable, Graphable
+
+
+class _Dag(Snapshotable, Graphable):
+    """In-memory DAG implementing only what the defaults need."""
+
+    def __init__(self, parents):
+        self._parents = parents
+
+    def snapshot_id(self):
+        return "head"
+
+    def parent_ids(self, snap_id=None):
+        return set(self._parents.get(snap_id or "head", ()))
+
+    def as_of(self, snap_id, opts=None):
+        raise NotImplementedError
+
+    def snapshot_meta(self, snap_id, opts=None):
+        return {"snapshot-id": snap_id}
+
+    def history(self, limit=None, since=None, opts=None):
+        raise NotImplementedError
+
+    def is_ancestor(self, a, b, opts=None):
+        raise NotImplementedError
+
+    def common_ancestor(self, a, b, opts=None):
+        raise NotImplementedError
+
+
+class _GraphOnly(Graphable):
+    history = is_ancestor = common_ancestor = _Dag.history
+
+
+class TestDefaultAncestors:
+    def test_diamond_visits_each_ancestor_once(self):
+        dag = _Dag({"d": ["b", "c"], "b": ["a"], "c": ["a"], "a": []})
+        result = dag.ancestors("d")
+        assert sorted(result[:2]) == ["b", "c"]
+        assert result[2:] == ["a"]
+
+    def test_root_has_no_ancestors(self):
+        assert _Dag({"a": []}).ancestors("a") == []
+
+    def test_requires_snapshotable(self):
+        with pytest.raises(NotImplementedError):
+            _GraphOnly().ancestors("x")
+
+
+class TestAsyncCompanions:
+    @pytest.mark.parametrize("abc", [
+        protocols.Snapshotable, protocols.Branchable, protocols.Graphable,
+        protocols.Mergeable, protocols.Overlayable, protocols.Watchable,
+    ])
+    def test_every_opts_method_has_one(self, abc):
+        for name, fn in vars(abc).items():
+            if name.endswith("_async") or not callable(fn):
+                continue
+            if "opts" in inspect.signature(fn).parameters:
+                companion = getattr(abc, f"{name}_async", None)
+                assert inspect.iscoroutinefunction(companion), name
+                assert companion.__doc__, name
+
+    def test_default_runs_sync_method(self):
+        dag = _Dag({"b": ["a"], "a": []})
+        assert asyncio.run(dag.ancestors_async("b")) == ["a"]
+        assert asyncio.run(dag.commit_info_async("b")) == {"snapshot-id": "b"}
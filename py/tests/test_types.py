@@ -0,0 +1,79 @@
+"""Tests for the core data types."""
+
+from dataclasses import astuple, fields
+
+import pytest
+
+from yggdrasil.types import HLC, SnapshotRef, Capabilities
+
+
+class TestHLC:
+    def test_pack_preserves_order(self):
+        clocks = [HLC(5, 0), HLC(5, 1), HLC(5, 7), HLC(6, 0), HLC(1_700_000_000_000, 3)]
+        packed = [c.packed() for c in clocks]
+        assert packed == sorted(packed)
+        assert [HLC.unpack(p) for p in packed] == clocks
+
+    def test_pack_rejects_oversized_logical(self):
+        with pytest.raises(ValueError):
+            HLC.pack(1, 1 << 20)
+
+    def test_tick_is_monotonic(self):
+        a = HLC.now()
+        b = a.tick()
+        assert b > a
+
+    def test_from_arrays(self):
+        assert HLC.from_arrays([1, 2], [0, 5]) == [HLC(1, 0), HLC(2, 5)]
+        assert HLC.from_arrays((), ()) == []
+        with pytest.raises(ValueError):
+            HLC.from_arrays([1, 2], [0])
+
+
+class TestSnapshotRef:
+    def test_json_roundtrip_normalizes_parents(self):
+        ref = SnapshotRef.from_json({
+            "system-id": "git:/repo",
+            "snapshot-id": "c3",
+            "parent-ids": ["c2", "c1"],
+            "hlc": {"physical": 10, "logical": 2},
+            "content-hash": None,
+        })
+        assert ref.parent_ids == ("c1", "c2")
+        assert ref.parent_set() == frozenset({"c1", "c2"})
+        assert SnapshotRef.from_json(ref.to_json()) == ref
+
+    def test_defaults(self):
+        ref = SnapshotRef("sys", "snap")
+        assert ref.parent_ids == ()
+        assert ref.to_json()["parent-ids"] == []
+
+    def test_direct_construction_normalizes_parents(self):
+        ref = SnapshotRef("sys", "snap", ("b", "a"))
+        assert ref.parent_ids == ("a", "b")
+        assert ref == SnapshotRef.from_json(ref.to_json())
+        listed = SnapshotRef("sys", "snap", ["a", "b"])
+        assert listed == ref and hash(listed) == hash(ref)
+        assert SnapshotRef("sys", "snap", {"b", "a"}) == ref
+
+    def test_to_json_is_fresh(self):
+        ref = SnapshotRef("sys", "snap", ("p",), HLC(1, 2))
+        ref.to_json()["parent-ids"].append("zzz")
+        assert SnapshotRef("sys", "snap", ("p",), HLC(1, 2)).to_json()["parent-ids"] == ["p"]
+        assert [f.name for f in fields(ref)] == [
+            "system_id", "snapshot_id", "parent_ids", "hlc", "content_hash"]
+        assert astuple(ref) == ("sys", "snap", ("p",), (1, 2), None)
+
+
+class TestCapabilities:
+    def test_json_roundtrip(self):
+        caps = Capabilities(snapshotable=True, mergeable=True)
+        data = caps.to_json()
+        assert data["snapshotable"] is True and data["branchable"] is False
+        assert Capabilities.from_json(data) == caps
+        data["snapshotable"] = False
+        assert Capabilities(snapshotable=True, mergeable=True).to_json()["snapshotable"] is True
+
+    def test_from_json_defaults_missing_keys(self):
+        assert Capabilities.from_json({"graphable": True}) == Capabilities(graphable=True)
+        assert Capabilities.from_json({}) == Capabilities()
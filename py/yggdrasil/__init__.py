@@ -14,5 +14,6 @@ from yggdrasil.protocols import (
     Overlayable,
     Watchable,
     SystemIdentity,
+    DEFAULT_OPTS,
 )
 from yggdrasil.types import SnapshotRef, HLC, Capabilities, Overlay, Conflict
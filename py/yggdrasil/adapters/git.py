@@ -3,38 +3,341 @@
 Thin wrapper around git CLI, mirrors the Clojure adapter.
 """
 
+import os
+import re
+import shutil
 import subprocess
-from typing import Set, Optional, List, Dict, Any
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Set, Optional, List, Dict, Any, Tuple, NamedTuple, Iterator, Iterable, Mapping
 
 from yggdrasil.protocols import (
-    SystemIdentity, Snapshotable, Branchable, Graphable, Mergeable,
+    SystemIdentity, Snapshotable, Branchable, Graphable, Mergeable, DEFAULT_OPTS,
 )
 from yggdrasil.types import SnapshotRef, Capabilities, Conflict
 
 
-def _git(repo_path: str, *args: str) -> str:
-    """Run a git command and return stdout."""
-    result = subprocess.run(
-        ["git", "-C", repo_path] + list(args),
-        capture_output=True, text=True,
+# git resolved once. CPython only takes its posix_spawn fast path when the
+# executable has a directory part, so a bare "git" always forks.
+_GIT = os.fsencode(shutil.which("git") or "git")
+
+# Spawn options for one-shot git calls. With the absolute _GIT, close_fds=False
+# is what lets CPython use posix_spawn instead of fork+exec (signals are still
+# restored, via setsigdef). It means fds marked inheritable (os.set_inheritable)
+# reach git; fds Python opens are non-inheritable by default (PEP 446), and the
+# adapter marks none.
+_SPAWN_OPTS = {"close_fds": False}
+
+
+def _spawn(argv: Tuple[bytes, ...], args: Iterable[str],
+           input: Optional[bytes] = None) -> Tuple[int, bytes, bytes]:
+    """Run git with the encoded `git -C <repo>` prefix; return (code, out, err)."""
+    proc = subprocess.Popen(
+        argv + tuple(os.fsencode(a) for a in args),
+        stdin=subprocess.PIPE if input is not None else None,
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, **_SPAWN_OPTS,
     )
-    if result.returncode != 0:
-        raise RuntimeError(f"git error: {result.stderr.strip()}")
-    return result.stdout.strip()
+    out, err = proc.communicate(input)
+    return proc.returncode, out, err
+
+
+def _git(argv: Tuple[bytes, ...], *args: str) -> str:
+    """Run git with the encoded `git -C <repo>` prefix and return stdout."""
+    code, out, err = _spawn(argv, args)
+    if code != 0:
+        raise RuntimeError(f"git error: {err.decode('utf-8', 'replace').strip()}")
+    return out.decode("utf-8", "replace").strip()
 
 
-def _git_lines(repo_path: str, *args: str) -> List[str]:
-    """Run a git command and return output lines."""
-    out = _git(repo_path, *args)
+def _git_lines(argv: Tuple[bytes, ...], *args: str) -> List[str]:
+    """Run git with the encoded `git -C <repo>` prefix and return output lines."""
+    out = _git(argv, *args)
     return out.split("\n") if out else []
 
 
+# ============================================================
+# Persistent cat-file channel
+# ============================================================
+
+def _stop_batch(proc: subprocess.Popen) -> None:
+    """End a cat-file process: EOF on stdin makes it exit, then reap it."""
+    try:
+        proc.stdin.close()
+    except OSError:
+        pass  # broken pipe from a child that already died
+    proc.wait()
+    proc.stdout.close()
+
+
+class _GitBatch:
+    """Long-lived `git cat-file --batch[-check]` process.
+
+    Object lookups are written to stdin one per line and answered on
+    stdout, so repeated reads cost a pipe round-trip instead of a fork/exec.
+    The process is started lazily on first use and restarted if it died.
+    It is stopped by close(), when the batch is garbage collected, or at
+    interpreter exit, whichever comes first.
+    """
+
+    def __init__(self, repo_path: str, mode: str):
+        self._argv = [_GIT, b"-C", os.fsencode(repo_path), b"cat-file", mode.encode()]
+        self._proc: Optional[subprocess.Popen] = None
+        self._finalizer: Optional[weakref.finalize] = None
+        self._lock = threading.Lock()
+
+    def _ensure(self) -> subprocess.Popen:
+        if self._proc is None or self._proc.poll() is not None:
+            if self._finalizer is not None:
+                self._finalizer()  # reap the dead child and close its pipes
+            self._proc = subprocess.Popen(
+                self._argv, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+            # holds the process, not self, so it can't keep the batch alive
+            self._finalizer = weakref.finalize(self, _stop_batch, self._proc)
+        return self._proc
+
+    def query(self, rev: str) -> Optional[Tuple[str, bytes]]:
+        """Look up rev. Returns (header, body) or None if the object is missing.
+
+        header is the reply line without its newline; body is the raw object
+        content for --batch and b"" for --batch-check.
+        """
+        if "\n" in rev:
+            raise ValueError(f"invalid revision: {rev!r}")
+        with self._lock:
+            proc = self._ensure()
+            try:
+                proc.stdin.write(rev.encode() + b"\n")
+                proc.stdin.flush()
+                header = proc.stdout.readline().rstrip(b"\n").decode()
+                if not header or header.endswith((" missing", " ambiguous")):
+                    return None
+                body = b""
+                if self._argv[-1] == b"--batch":
+                    size = int(header.rsplit(" ", 1)[1])
+                    # content is followed by a single LF terminator
+                    remaining = size + 1
+                    chunks = []
+                    while remaining:
+                        chunk = proc.stdout.read(remaining)
+                        if not chunk:
+                            raise RuntimeError("git cat-file terminated unexpectedly")
+                        chunks.append(chunk)
+                        remaining -= len(chunk)
+                    body = b"".join(chunks)[:-1]
+                return header, body
+            except BaseException:
+                # a reply may be left half-read in the pipe: drop the process so
+                # the next query starts in sync instead of reading it as a header
+                self._discard()
+                raise
+
+    def _discard(self) -> None:
+        """Kill and reap the current process; the next query starts afresh."""
+        proc, finalizer = self._proc, self._finalizer
+        self._proc = self._finalizer = None
+        if proc is not None:
+            proc.kill()
+        if finalizer is not None:
+            finalizer()
+
+    def close(self) -> None:
+        with self._lock:
+            finalizer, self._finalizer = self._finalizer, None
+            self._proc = None
+        if finalizer is not None:
+            finalizer()
+
+
+_FULL_SHA = re.compile(r"[0-9a-f]{40}|[0-9a-f]{64}")
+
+_COMMIT_CACHE_SIZE = 1024
+
+# Per-cache bound for the is_ancestor and common_ancestor answers.
+_ANCESTRY_CACHE_SIZE = 4096
+
+
+class _LRU:
+    """Bounded map evicting the least recently used key; thread-safe."""
+
+    def __init__(self, size: int):
+        self._size = size
+        self._data: "OrderedDict[Any, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Any:
+        """Value for key, marked most recently used, or None if absent."""
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key: Any, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self._size:
+                self._data.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[Any]:
+        with self._lock:
+            return iter(list(self._data))
+
+
+_PACKED_BRANCH = re.compile(rb"^[0-9a-f]+ refs/heads/(\S+)$", re.M)
+
+# What .git/HEAD holds in a reftable repo, where refs aren't files.
+_REFTABLE_HEAD = "ref: refs/heads/.invalid"
+
+
+def _stat_stamp(path: str) -> Optional[Tuple[int, int, int]]:
+    """(inode, mtime_ns, size) of path, or None if it doesn't exist.
+
+    git rewrites refs by renaming a lock file over them, so any update
+    changes at least the inode or the mtime.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_ino, st.st_mtime_ns, st.st_size
+
+
+class _Commit(NamedTuple):
+    """Fields of a parsed commit object."""
+    sha: str
+    parents: Tuple[str, ...]
+    author: str  # "name <email>"
+    timestamp: int  # author time, milliseconds since epoch
+    message: str  # full commit message
+
+
+def _parse_commit(sha: str, raw: bytes) -> _Commit:
+    """Parse the raw bytes of a commit object as printed by cat-file."""
+    header, _, body = raw.decode("utf-8", "replace").partition("\n\n")
+    parents = []
+    author, timestamp = "", 0
+    for line in header.split("\n"):
+        if line.startswith("parent "):
+            parents.append(line[7:])
+        elif line.startswith("author "):
+            # author <name> <<email>> <epoch-seconds> <tz>
+            author, ts, _tz = line[7:].rsplit(" ", 2)
+            timestamp = int(ts) * 1000
+    # full message, as git's %B, without the trailing newline
+    return _Commit(sha, tuple(parents), author, timestamp, body.rstrip("\n"))
+
+
+# git log format yielding the same fields; records are NUL-terminated via -z
+_META_FORMAT = "%H%x01%P%x01%an <%ae>%x01%at%x01%B"
+
+
+def _commit_meta(commit: _Commit) -> Dict[str, Any]:
+    return {
+        "snapshot-id": commit.sha,
+        "parent-ids": set(commit.parents),
+        "author": commit.author,
+        "timestamp": commit.timestamp,
+        "message": commit.message,
+    }
+
+
+_CAPS = Capabilities(
+    snapshotable=True,
+    branchable=True,
+    graphable=True,
+    mergeable=True,
+    overlayable=False,
+    watchable=False,
+)
+
+
 class GitSystem(SystemIdentity, Snapshotable, Branchable, Graphable, Mergeable):
-    """Git repository adapter implementing Yggdrasil protocols."""
+    """Git repository adapter implementing Yggdrasil protocols.
+
+    HEAD's commit and branch name are cached between calls. The adapter's
+    own mutators refresh them, and each read revalidates them against the
+    inode, mtime and size of HEAD, the checked-out branch's ref file and
+    packed-refs, so commits and checkouts made by other processes are
+    picked up. Where refs aren't plain files (reftable, or a repo_path
+    whose git dir can't be resolved) there is nothing to stat and HEAD is
+    re-read on every call instead. invalidate() only matters for changes
+    that leave every stamp intact.
+
+    One system may be shared between threads, e.g. by concurrent *_async
+    calls: the cat-file channels, the HEAD state and each cache have their
+    own lock. Concurrent mutators (branch, checkout, merge) are still
+    subject to git's own index and ref locking.
+    """
 
     def __init__(self, repo_path: str, system_name: Optional[str] = None):
         self.repo_path = repo_path
         self._system_name = system_name
+        self._argv = (_GIT, b"-C", os.fsencode(repo_path))
+        self._check = _GitBatch(repo_path, "--batch-check")
+        self._cat = _GitBatch(repo_path, "--batch")
+        # HEAD state below is read and refilled under this lock, so *_async
+        # calls running in worker threads can share one system
+        self._head_lock = threading.RLock()
+        self._snap_cache: Optional[str] = None
+        self._branch_cache: Optional[str] = None
+        # ref file stamps the caches were filled under; see _head_stamp
+        self._snap_stamp: Optional[tuple] = None
+        self._branch_stamp: Optional[tuple] = None
+        self._dirs: Optional[Tuple[str, ...]] = None  # see _git_dirs
+        # parsed commits by sha; commits are immutable so entries never go stale
+        self._commits = _LRU(_COMMIT_CACHE_SIZE)
+        # ancestry answers for pairs of full shas, equally immutable
+        self._merge_base = _LRU(_ANCESTRY_CACHE_SIZE)
+        self._is_anc = _LRU(_ANCESTRY_CACHE_SIZE)
+
+    def invalidate(self) -> None:
+        """Forget cached HEAD state after the repository changed externally.
+
+        Only needed for changes that leave the ref file stamps intact; see
+        the class docstring.
+        """
+        with self._head_lock:
+            self._snap_cache = None
+            self._branch_cache = None
+
+    def close(self) -> None:
+        """Stop the persistent cat-file processes. Safe to call repeatedly."""
+        self._check.close()
+        self._cat.close()
+
+    def __enter__(self) -> "GitSystem":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _read_commit(self, ref: str) -> Optional[_Commit]:
+        """Parsed commit that ref points to, or None if it doesn't resolve."""
+        if _FULL_SHA.fullmatch(ref):
+            commit = self._commits.get(ref)
+            if commit is not None:
+                return commit
+        reply = self._cat.query(f"{ref}^{{commit}}")
+        if reply is None:
+            return None
+        header, raw = reply
+        sha = header.split(" ", 1)[0]
+        commit = self._commits.get(sha)
+        if commit is None:
+            commit = self._remember(_parse_commit(sha, raw))
+        return commit
+
+    def _remember(self, commit: _Commit) -> _Commit:
+        """Add a parsed commit to the cache, evicting the least recently used."""
+        self._commits.put(commit.sha, commit)
+        return commit
 
     # -- SystemIdentity --
 
@@ -45,128 +348,296 @@ class GitSystem(SystemIdentity, Snapshotable, Branchable, Graphable, Mergeable):
         return "git"
 
     def capabilities(self) -> Capabilities:
-        return Capabilities(
-            snapshotable=True,
-            branchable=True,
-            graphable=True,
-            mergeable=True,
-            overlayable=False,
-            watchable=False,
-        )
+        return _CAPS
 
     # -- Snapshotable --
 
     def snapshot_id(self) -> str:
-        return _git(self.repo_path, "rev-parse", "HEAD")
+        with self._head_lock:
+            stamp = self._ref_stamp()
+            # with no stamp to check against, nothing is cached
+            if stamp is None or self._snap_cache is None or stamp != self._snap_stamp:
+                self._snap_stamp = stamp  # taken before the read, so never newer
+                reply = self._check.query("HEAD^{commit}")
+                if reply is None:
+                    raise RuntimeError("git error: HEAD does not point to a commit")
+                self._snap_cache = reply[0].split(" ", 1)[0]
+            return self._snap_cache
 
     def parent_ids(self, snap_id: Optional[str] = None) -> Set[str]:
-        ref = snap_id or "HEAD"
-        try:
-            out = _git(self.repo_path, "rev-parse", f"{ref}^@")
-        except RuntimeError:
-            return set()
-        return set(out.split("\n")) if out else set()
+        commit = self._read_commit(snap_id or "HEAD")
+        return set(commit.parents) if commit else set()
 
-    def as_of(self, snap_id: str, opts: Optional[Dict[str, Any]] = None) -> Any:
+    def as_of(self, snap_id: str, opts: Mapping[str, Any] = DEFAULT_OPTS) -> Any:
         return {"repo_path": self.repo_path, "commit": snap_id}
 
-    def snapshot_meta(self, snap_id: str, opts: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        fmt = "%H%n%P%n%an <%ae>%n%at%n%s"
-        lines = _git_lines(self.repo_path, "log", "-1", f"--format={fmt}", snap_id)
-        if len(lines) < 5:
+    def snapshot_meta(self, snap_id: str, opts: Mapping[str, Any] = DEFAULT_OPTS) -> Dict[str, Any]:
+        commit = self._read_commit(snap_id)
+        if commit is None:
+            raise RuntimeError(f"git error: unknown revision {snap_id}")
+        return _commit_meta(commit)
+
+    def snapshot_meta_many(self, snap_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """snapshot_meta for many snapshots with a single git process.
+
+        Revisions are fed to `git log --no-walk --stdin`; the result maps each
+        commit's full id to its metadata.
+        """
+        revs = list(snap_ids)
+        if not revs:
             return {}
-        parent_str = lines[1]
-        return {
-            "snapshot-id": lines[0],
-            "parent-ids": set(parent_str.split()) if parent_str else set(),
-            "author": lines[2],
-            "timestamp": int(lines[3]) * 1000,
-            "message": lines[4],
-        }
+        if any("\n" in rev for rev in revs):
+            raise ValueError("revisions must not contain newlines")
+        code, out, err = _spawn(
+            self._argv,
+            ("log", "--no-walk=unsorted", "--stdin", "-z", f"--format={_META_FORMAT}"),
+            input="\n".join(revs).encode() + b"\n",
+        )
+        if code != 0:
+            raise RuntimeError(f"git error: {err.decode('utf-8', 'replace').strip()}")
+        metas = {}
+        for record in out.decode("utf-8", "replace").split("\0"):
+            if not record:
+                continue
+            sha, parents, author, ts, message = record.split("\x01", 4)
+            commit = self._remember(_Commit(sha, tuple(parents.split()), author,
+                                            int(ts) * 1000, message.rstrip("\n")))
+            metas[sha] = _commit_meta(commit)
+        return metas
 
     # -- Branchable --
 
-    def branches(self, opts: Optional[Dict[str, Any]] = None) -> Set[str]:
-        lines = _git_lines(self.repo_path, "branch", "--list", "--format=%(refname:short)")
-        return set(lines)
+    def _git_dirs(self) -> Optional[Tuple[str, str]]:
+        """(git dir, common dir) of repo_path, or None if not resolvable.
+
+        Follows GIT_DIR, a `.git` directory, or a `.git` file pointing at a
+        linked worktree's git dir (whose refs live in its commondir), and
+        treats a repo_path holding HEAD itself as a bare repo. Anything else
+        (e.g. a subdirectory of a work tree) is asked of `git rev-parse`.
+        Reftable repos count as not resolvable.
+        """
+        if self._dirs is None:
+            git_dir = os.path.join(self.repo_path, os.environ.get("GIT_DIR", ".git"))
+            if os.path.isfile(git_dir):
+                try:
+                    with open(git_dir) as f:
+                        line = f.readline().strip()
+                except OSError:
+                    line = ""
+                git_dir = (os.path.join(self.repo_path, line[len("gitdir: "):])
+                           if line.startswith("gitdir: ") else "")
+            elif not os.path.isdir(git_dir) and os.path.isfile(
+                    os.path.join(self.repo_path, "HEAD")):
+                git_dir = self.repo_path  # bare
+            if git_dir and os.path.isfile(os.path.join(git_dir, "HEAD")):
+                try:
+                    with open(os.path.join(git_dir, "commondir")) as f:
+                        common = os.path.join(git_dir, f.read().strip())
+                except FileNotFoundError:
+                    common = git_dir
+            else:
+                code, out, _err = _spawn(self._argv, (
+                    "rev-parse", "--path-format=absolute", "--git-dir", "--git-common-dir"))
+                lines = out.decode("utf-8", "replace").splitlines() if code == 0 else []
+                git_dir, common = lines if len(lines) == 2 else ("", "")
+            # reftable refs aren't files; leave them to git
+            if not git_dir or os.path.isdir(os.path.join(common, "reftable")):
+                self._dirs = ()
+            else:
+                self._dirs = (git_dir, common)
+        return self._dirs or None
+
+    def _read_branches_fs(self) -> Optional[Set[str]]:
+        """Branch names from refs/heads and packed-refs in the git dir.
+
+        Returns None when there is no files ref store to read (bare repo,
+        subdirectory, reftable), so callers fall back to git.
+        """
+        dirs = self._git_dirs()
+        if dirs is None:
+            return None
+        common = dirs[1]
+        heads = os.path.join(common, "refs", "heads")
+        if not os.path.isdir(heads) or os.path.exists(os.path.join(common, "reftable")):
+            return None
+        names = set()
+        for root, _dirs, files in os.walk(heads):
+            prefix = os.path.relpath(root, heads).replace(os.sep, "/")
+            for f in files:
+                if not f.endswith(".lock"):
+                    names.add(f if prefix == "." else f"{prefix}/{f}")
+        try:
+            with open(os.path.join(common, "packed-refs"), "rb") as fh:
+                names.update(m.decode() for m in _PACKED_BRANCH.findall(fh.read()))
+        except FileNotFoundError:
+            pass
+        return names
+
+    def branches(self, opts: Mapping[str, Any] = DEFAULT_OPTS) -> Set[str]:
+        names = self._read_branches_fs()
+        if names is None:
+            names = set(_git_lines(self._argv, "branch", "--list", "--format=%(refname:short)"))
+        return names
 
     def current_branch(self) -> str:
-        return _git(self.repo_path, "rev-parse", "--abbrev-ref", "HEAD")
+        """Checked-out branch name, or "HEAD" when detached."""
+        with self._head_lock:
+            stamp = self._head_stamp()
+            if stamp is None or self._branch_cache is None or stamp != self._branch_stamp:
+                self._branch_stamp = stamp
+                head = ""
+                dirs = self._git_dirs()
+                if dirs is not None:
+                    try:
+                        with open(os.path.join(dirs[0], "HEAD")) as f:
+                            head = f.read().strip()
+                    except OSError:
+                        pass
+                if head.startswith("ref: refs/heads/") and head != _REFTABLE_HEAD:
+                    self._branch_cache = head[len("ref: refs/heads/"):]
+                elif head and not head.startswith("ref: "):
+                    self._branch_cache = "HEAD"  # detached: HEAD holds a commit id
+                else:
+                    self._branch_cache = self._symbolic_head()
+            return self._branch_cache
+
+    def _head_stamp(self) -> Optional[tuple]:
+        """Stamp of the HEAD file; None if the git dir isn't resolvable."""
+        dirs = self._git_dirs()
+        return None if dirs is None else _stat_stamp(os.path.join(dirs[0], "HEAD"))
+
+    def _ref_stamp(self) -> Optional[tuple]:
+        """Stamps of every file HEAD's commit is read from, or None."""
+        head = self._head_stamp()
+        if head is None:
+            return None
+        common = self._dirs[1]
+        branch = self.current_branch()
+        ref = (None if branch == "HEAD" else
+               _stat_stamp(os.path.join(common, "refs", "heads", branch)))
+        return head, ref, _stat_stamp(os.path.join(common, "packed-refs"))
+
+    def _symbolic_head(self) -> str:
+        """current_branch via `git symbolic-ref`, for repos not read directly."""
+        code, out, err = _spawn(self._argv, ("symbolic-ref", "--short", "-q", "HEAD"))
+        if code == 1:
+            return "HEAD"
+        if code != 0:
+            raise RuntimeError(f"git error: {err.decode('utf-8', 'replace').strip()}")
+        return out.decode("utf-8", "replace").strip()
 
     def branch(self, name: str, from_ref: Optional[str] = None,
-               opts: Optional[Dict[str, Any]] = None) -> "GitSystem":
+               opts: Mapping[str, Any] = DEFAULT_OPTS) -> "GitSystem":
+        self.invalidate()
         args = ["branch", name]
         if from_ref:
             args.append(from_ref)
-        _git(self.repo_path, *args)
+        _git(self._argv, *args)
         return self
 
-    def delete_branch(self, name: str, opts: Optional[Dict[str, Any]] = None) -> "GitSystem":
-        _git(self.repo_path, "branch", "-d", name)
+    def delete_branch(self, name: str, opts: Mapping[str, Any] = DEFAULT_OPTS) -> "GitSystem":
+        self.invalidate()
+        _git(self._argv, "branch", "-d", name)
         return self
 
-    def checkout(self, name: str, opts: Optional[Dict[str, Any]] = None) -> "GitSystem":
-        _git(self.repo_path, "checkout", name)
+    def checkout(self, name: str, opts: Mapping[str, Any] = DEFAULT_OPTS) -> "GitSystem":
+        self.invalidate()
+        _git(self._argv, "checkout", name)
         return self
 
     # -- Graphable --
 
     def history(self, limit: Optional[int] = None, since: Optional[str] = None,
-                opts: Optional[Dict[str, Any]] = None) -> List[str]:
+                opts: Mapping[str, Any] = DEFAULT_OPTS) -> List[str]:
         args = ["log", "--format=%H"]
         if limit:
             args.append(f"-{limit}")
         if since:
             args.append(f"{since}..HEAD")
-        return _git_lines(self.repo_path, *args)
+        return _git_lines(self._argv, *args)
 
-    def ancestors(self, snap_id: str, opts: Optional[Dict[str, Any]] = None) -> List[str]:
-        return _git_lines(self.repo_path, "rev-list", snap_id)
+    def ancestors(self, snap_id: str, opts: Mapping[str, Any] = DEFAULT_OPTS) -> List[str]:
+        """Ancestor ids of snap_id, excluding snap_id itself, newest first."""
+        return list(self.ancestors_iter(snap_id))
 
-    def is_ancestor(self, a: str, b: str, opts: Optional[Dict[str, Any]] = None) -> bool:
+    def ancestors_iter(self, snap_id: str, limit: Optional[int] = None) -> Iterator[str]:
+        """Stream ancestor ids (rev-list order) without materializing them.
+
+        Like ancestors, snap_id itself is not included. Stopping iteration
+        early terminates the underlying git process. limit caps the number
+        of ids produced.
+        """
+        args = self._argv + (b"rev-list",)
+        if limit:
+            args += (b"--max-count=%d" % (limit + 1),)
+        args += (os.fsencode(snap_id),)
+        proc = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                **_SPAWN_OPTS)
         try:
-            _git(self.repo_path, "merge-base", "--is-ancestor", a, b)
-            return True
-        except RuntimeError:
-            return False
+            proc.stdout.readline()  # rev-list lists snap_id itself first
+            for line in proc.stdout:
+                yield line.rstrip(b"\n").decode("ascii")
+            if proc.wait() != 0:
+                err = proc.stderr.read().decode("utf-8", "replace").strip()
+                raise RuntimeError(f"git error: {err}")
+        finally:
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+            proc.stdout.close()
+            proc.stderr.close()
+
+    def is_ancestor(self, a: str, b: str, opts: Mapping[str, Any] = DEFAULT_OPTS) -> bool:
+        key = (a, b)
+        cached = self._is_anc.get(key)
+        if cached is not None:
+            return cached
+        code = _spawn(self._argv, ("merge-base", "--is-ancestor", a, b))[0]
+        # exit 1 is a definite "no"; anything else non-zero is an error
+        if code in (0, 1) and _FULL_SHA.fullmatch(a) and _FULL_SHA.fullmatch(b):
+            self._is_anc.put(key, code == 0)
+        return code == 0
 
     def common_ancestor(self, a: str, b: str,
-                        opts: Optional[Dict[str, Any]] = None) -> Optional[str]:
+                        opts: Mapping[str, Any] = DEFAULT_OPTS) -> Optional[str]:
+        key = (a, b)
+        cached = self._merge_base.get(key)
+        if cached is not None:
+            return cached
         try:
-            return _git(self.repo_path, "merge-base", a, b)
+            base = _git(self._argv, "merge-base", a, b)
         except RuntimeError:
             return None
+        if _FULL_SHA.fullmatch(a) and _FULL_SHA.fullmatch(b):
+            self._merge_base.put(key, base)
+        return base
 
     # -- Mergeable --
 
     def merge(self, source: str, strategy: Optional[str] = None,
               message: Optional[str] = None,
-              opts: Optional[Dict[str, Any]] = None) -> "GitSystem":
+              opts: Mapping[str, Any] = DEFAULT_OPTS) -> "GitSystem":
+        self.invalidate()
         args = ["merge"]
         if strategy:
             args.append(f"--strategy-option={strategy}")
         if message:
             args.extend(["-m", message])
         args.append(source)
-        _git(self.repo_path, *args)
+        _git(self._argv, *args)
         return self
 
     def conflicts(self, a: str, b: str,
-                  opts: Optional[Dict[str, Any]] = None) -> List[Conflict]:
-        try:
-            base = _git(self.repo_path, "merge-base", a, b)
-        except RuntimeError:
+                  opts: Mapping[str, Any] = DEFAULT_OPTS) -> List[Conflict]:
+        base = self.common_ancestor(a, b)
+        if base is None:
             return []
-        result = subprocess.run(
-            ["git", "-C", self.repo_path, "merge-tree", base, a, b],
-            capture_output=True, text=True,
-        )
-        if result.returncode != 0:
+        if _spawn(self._argv, ("merge-tree", base, a, b))[0] != 0:
             return [Conflict(path=("merge-tree",), base=base, ours=a, theirs=b)]
         return []
 
-    def diff(self, a: str, b: str, opts: Optional[Dict[str, Any]] = None) -> Any:
-        return _git(self.repo_path, "diff", a, b)
+    def diff(self, a: str, b: str, opts: Mapping[str, Any] = DEFAULT_OPTS) -> Any:
+        return _git(self._argv, "diff", a, b)
 
 
 def create(repo_path: str, system_name: Optional[str] = None) -> GitSystem:
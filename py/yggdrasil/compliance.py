@@ -6,14 +6,36 @@ Python port of the Clojure compliance suite. Adapters provide a fixture dict:
         "create_system": lambda: ...,       # fresh system with 'main' branch
         "mutate": lambda sys: ...,          # perform a mutation, return system
         "commit": lambda sys, msg: ...,     # commit, return system
+        "mutate_commit": lambda sys, msg: ...,  # optional: mutate + commit in one step
         "close": lambda sys: ...,           # cleanup
         "write_entry": lambda sys, k, v: ...,  # write keyed entry, return system
+        "write_entries": lambda sys, kvs: ...,  # optional: write many (k, v) pairs at once
         "read_entry": lambda sys, k: ...,      # read by key, or None
         "count_entries": lambda sys: ...,      # count entries in current state
         "delete_entry": lambda sys, k: ...,    # delete by key, return system (or None)
+        "create_seeded": lambda entries, msg: ...,  # optional: fresh system with
+                                                    # entries committed as msg
+        "acquire_pooled": lambda: ...,      # optional: recycled system, reset to the
+                                            # state create_system returns
+        "release_pooled": lambda sys: ...,  # optional: hand sys back to the pool
     }
 
-Usage with pytest:
+Usage with pytest -- one test case per compliance test, so failures are
+reported individually and pytest-xdist can distribute them:
+
+    from yggdrasil.compliance import make_pytest_generate_tests
+
+    GIT_FIXTURE = {...}
+    pytest_generate_tests = make_pytest_generate_tests(GIT_FIXTURE)
+
+    @pytest.fixture
+    def git_fixture():
+        return GIT_FIXTURE
+
+    def test_compliance(git_fixture, test_fn):
+        test_fn(git_fixture)
+
+Or as a single test:
 
     from yggdrasil.compliance import run_compliance_tests
 
@@ -21,21 +43,134 @@ Usage with pytest:
         run_compliance_tests(git_fixture)
 """
 
-from typing import Dict, Any, Callable, Optional
+from dataclasses import fields
+from typing import Dict, Any, Callable, Optional, Tuple
+
+from yggdrasil.types import Capabilities
 
 
 # ============================================================
 # Helpers
 # ============================================================
 
-def _has_capability(fixture: Dict[str, Any], cap: str) -> bool:
-    """Check if system supports a capability."""
-    sys = fixture["create_system"]()
+# One bit per protocol layer, in Capabilities field order.
+_CAP_BITS: Dict[str, int] = {f.name: 1 << i for i, f in enumerate(fields(Capabilities))}
+
+# Fixture key caching the capability bitmask of the fixture's systems.
+_CAPS_MASK_KEY = "_caps_mask"
+
+
+def _caps_mask(fixture: Dict[str, Any]) -> int:
+    """Capability bitmask for fixture's systems.
+
+    Computed from one system on first use and stored in the fixture itself,
+    so the cache lives exactly as long as the fixture does.
+    """
+    mask = fixture.get(_CAPS_MASK_KEY)
+    if mask is None:
+        sys = fixture["create_system"]()
+        try:
+            caps = sys.capabilities()
+            mask = 0
+            for name, bit in _CAP_BITS.items():
+                if getattr(caps, name, False):
+                    mask |= bit
+        finally:
+            fixture["close"](sys)
+        fixture[_CAPS_MASK_KEY] = mask
+    return mask
+
+
+def _requires(*caps: str, fixture_keys: Tuple[str, ...] = ()) -> Callable:
+    """Declare the capabilities and optional fixture keys a test needs."""
+    def mark(test_fn: Callable) -> Callable:
+        test_fn.requires = caps
+        test_fn.requires_mask = sum(_CAP_BITS[cap] for cap in caps)
+        test_fn.requires_keys = fixture_keys
+        return test_fn
+    return mark
+
+
+def _read_only(test_fn: Callable) -> Callable:
+    """Mark a test that never mutates its system, so it may run on a shared one."""
+    test_fn.read_only = True
+    return test_fn
+
+
+def with_shared_system(fixture: Dict[str, Any], sys: Any) -> Dict[str, Any]:
+    """Fixture view whose create_system returns sys and whose close is a no-op.
+
+    Use it for tests marked read_only to reuse one long-lived system
+    instead of building and tearing down a fresh one per test.
+    """
+    return {**fixture,
+            "create_system": lambda: sys, "close": lambda _sys: None,
+            "acquire_pooled": lambda: sys, "release_pooled": lambda _sys: None}
+
+
+def skip_reason(fixture: Dict[str, Any], test_fn: Callable) -> Optional[str]:
+    """Why test_fn can't run against fixture, or None if it can."""
+    missing = getattr(test_fn, "requires_mask", 0) & ~_caps_mask(fixture)
+    if missing:
+        names = [cap for cap in test_fn.requires if missing & _CAP_BITS[cap]]
+        return f"{' and '.join(names)} not supported"
+    for key in getattr(test_fn, "requires_keys", ()):
+        if fixture.get(key) is None:
+            return f"fixture provides no {key}"
+    return None
+
+
+def _create_seeded(fix: Dict[str, Any], entries: Tuple[Tuple[str, str], ...],
+                   msg: str) -> Any:
+    """Fresh system with entries written and committed as msg.
+
+    Uses the fixture's create_seeded when it has one, otherwise replays the
+    writes on a new system.
+    """
+    create_seeded = fix.get("create_seeded")
+    if create_seeded is not None:
+        return create_seeded(entries, msg)
+    sys = fix["create_system"]()
     try:
-        caps = sys.capabilities()
-        return getattr(caps, cap, False)
-    finally:
-        fixture["close"](sys)
+        return fix["commit"](_write_entries(fix, sys, entries), msg)
+    except BaseException:
+        fix["close"](sys)
+        raise
+
+
+def _acquire(fix: Dict[str, Any]) -> Any:
+    """System from the fixture's pool, or a fresh one if it has none."""
+    acquire_pooled = fix.get("acquire_pooled")
+    if acquire_pooled is not None:
+        return acquire_pooled()
+    return fix["create_system"]()
+
+
+def _release(fix: Dict[str, Any], sys: Any) -> None:
+    """Return a system from _acquire: back to the pool, or close it."""
+    release_pooled = fix.get("release_pooled")
+    if release_pooled is not None:
+        release_pooled(sys)
+    else:
+        fix["close"](sys)
+
+
+def _write_entries(fix: Dict[str, Any], sys: Any, entries) -> Any:
+    """Write (key, value) pairs, in bulk when the fixture supports it."""
+    write_entries = fix.get("write_entries")
+    if write_entries is not None:
+        return write_entries(sys, entries)
+    for key, value in entries:
+        sys = fix["write_entry"](sys, key, value)
+    return sys
+
+
+def _mutate_commit(fix: Dict[str, Any], sys: Any, msg: str) -> Any:
+    """Mutate and commit, using the fixture's combined op when it has one."""
+    mutate_commit = fix.get("mutate_commit")
+    if mutate_commit is not None:
+        return mutate_commit(sys, msg)
+    return fix["commit"](fix["mutate"](sys), msg)
 
 
 # ============================================================
@@ -46,8 +181,7 @@ def test_snapshot_id_after_commit(fix: Dict[str, Any]) -> None:
     """snapshot_id returns the current commit ID after a commit."""
     sys = fix["create_system"]()
     try:
-        sys = fix["mutate"](sys)
-        sys = fix["commit"](sys, "first")
+        sys = _mutate_commit(fix, sys, "first")
         sid = sys.snapshot_id()
         assert isinstance(sid, str), "snapshot_id should return a string"
         assert len(sid) > 0, "snapshot_id should be non-empty"
@@ -59,8 +193,7 @@ def test_parent_ids_root_commit(fix: Dict[str, Any]) -> None:
     """Root of the DAG has empty parent_ids."""
     sys = fix["create_system"]()
     try:
-        sys = fix["mutate"](sys)
-        sys = fix["commit"](sys, "root")
+        sys = _mutate_commit(fix, sys, "root")
         # Walk back to the actual root commit
         snap = sys.snapshot_id()
         while True:
@@ -78,11 +211,9 @@ def test_parent_ids_chain(fix: Dict[str, Any]) -> None:
     """Second commit has first commit as parent."""
     sys = fix["create_system"]()
     try:
-        sys = fix["mutate"](sys)
-        sys = fix["commit"](sys, "first")
+        sys = _mutate_commit(fix, sys, "first")
         first_id = sys.snapshot_id()
-        sys = fix["mutate"](sys)
-        sys = fix["commit"](sys, "second")
+        sys = _mutate_commit(fix, sys, "second")
         parents = sys.parent_ids()
         assert first_id in parents, "Second commit should have first commit as parent"
     finally:
@@ -93,8 +224,7 @@ def test_snapshot_meta(fix: Dict[str, Any]) -> None:
     """snapshot_meta returns metadata for a commit."""
     sys = fix["create_system"]()
     try:
-        sys = fix["mutate"](sys)
-        sys = fix["commit"](sys, "test message")
+        sys = _mutate_commit(fix, sys, "test message")
         sid = sys.snapshot_id()
         meta = sys.snapshot_meta(sid)
         assert meta is not None, "snapshot_meta should return non-None"
@@ -109,8 +239,7 @@ def test_as_of(fix: Dict[str, Any]) -> None:
     """as_of returns a read-only view at a snapshot."""
     sys = fix["create_system"]()
     try:
-        sys = fix["mutate"](sys)
-        sys = fix["commit"](sys, "snapshot point")
+        sys = _mutate_commit(fix, sys, "snapshot point")
         sid = sys.snapshot_id()
         view = sys.as_of(sid)
         assert view is not None, "as_of should return non-None"
@@ -122,10 +251,10 @@ def test_as_of(fix: Dict[str, Any]) -> None:
 # Layer 2: Branchable tests
 # ============================================================
 
+@_read_only
+@_requires("branchable")
 def test_initial_branches(fix: Dict[str, Any]) -> None:
     """Fresh system has a main branch."""
-    if not _has_capability(fix, "branchable"):
-        return
     sys = fix["create_system"]()
     try:
         branches = sys.branches()
@@ -135,14 +264,12 @@ def test_initial_branches(fix: Dict[str, Any]) -> None:
         fix["close"](sys)
 
 
+@_requires("branchable")
 def test_create_branch(fix: Dict[str, Any]) -> None:
     """branch creates a new branch and returns self."""
-    if not _has_capability(fix, "branchable"):
-        return
     sys = fix["create_system"]()
     try:
-        sys = fix["mutate"](sys)
-        sys = fix["commit"](sys, "before fork")
+        sys = _mutate_commit(fix, sys, "before fork")
         sys = sys.branch("experiment")
         assert "experiment" in sys.branches(), \
             "Should have 'experiment' branch after branching"
@@ -152,14 +279,12 @@ def test_create_branch(fix: Dict[str, Any]) -> None:
         fix["close"](sys)
 
 
+@_requires("branchable")
 def test_checkout(fix: Dict[str, Any]) -> None:
     """checkout returns self on target branch."""
-    if not _has_capability(fix, "branchable"):
-        return
     sys = fix["create_system"]()
     try:
-        sys = fix["mutate"](sys)
-        sys = fix["commit"](sys, "before fork")
+        sys = _mutate_commit(fix, sys, "before fork")
         sys = sys.branch("experiment")
         sys = sys.checkout("experiment")
         assert sys.current_branch() == "experiment", \
@@ -168,20 +293,17 @@ def test_checkout(fix: Dict[str, Any]) -> None:
         fix["close"](sys)
 
 
+@_requires("branchable")
 def test_branch_isolation(fix: Dict[str, Any]) -> None:
     """Commits on one branch don't affect another."""
-    if not _has_capability(fix, "branchable"):
-        return
     sys = fix["create_system"]()
     try:
-        sys = fix["mutate"](sys)
-        sys = fix["commit"](sys, "main commit")
+        sys = _mutate_commit(fix, sys, "main commit")
         sys = sys.branch("experiment")
         main_after_fork = sys.snapshot_id()
         # Advance experiment
         sys = sys.checkout("experiment")
-        sys = fix["mutate"](sys)
-        sys = fix["commit"](sys, "experiment commit")
+        sys = _mutate_commit(fix, sys, "experiment commit")
         # Main should still be at fork point
         sys = sys.checkout("main")
         assert sys.snapshot_id() == main_after_fork, \
@@ -190,14 +312,12 @@ def test_branch_isolation(fix: Dict[str, Any]) -> None:
         fix["close"](sys)
 
 
+@_requires("branchable")
 def test_delete_branch(fix: Dict[str, Any]) -> None:
     """delete_branch returns system without the branch."""
-    if not _has_capability(fix, "branchable"):
-        return
     sys = fix["create_system"]()
     try:
-        sys = fix["mutate"](sys)
-        sys = fix["commit"](sys, "before fork")
+        sys = _mutate_commit(fix, sys, "before fork")
         sys = sys.branch("temp")
         assert "temp" in sys.branches()
         sys = sys.delete_branch("temp")
@@ -211,18 +331,14 @@ def test_delete_branch(fix: Dict[str, Any]) -> None:
 # Layer 3: Graphable tests
 # ============================================================
 
+@_requires("graphable")
 def test_history(fix: Dict[str, Any]) -> None:
     """history returns commit IDs newest first."""
-    if not _has_capability(fix, "graphable"):
-        return
     sys = fix["create_system"]()
     try:
-        sys = fix["mutate"](sys)
-        sys = fix["commit"](sys, "first")
-        sys = fix["mutate"](sys)
-        sys = fix["commit"](sys, "second")
-        sys = fix["mutate"](sys)
-        sys = fix["commit"](sys, "third")
+        sys = _mutate_commit(fix, sys, "first")
+        sys = _mutate_commit(fix, sys, "second")
+        sys = _mutate_commit(fix, sys, "third")
         id3 = sys.snapshot_id()
         hist = sys.history()
         assert hist[0] == id3, "Most recent commit should be first"
@@ -231,54 +347,46 @@ def test_history(fix: Dict[str, Any]) -> None:
         fix["close"](sys)
 
 
+@_requires("graphable")
 def test_history_limit(fix: Dict[str, Any]) -> None:
     """history respects limit parameter."""
-    if not _has_capability(fix, "graphable"):
-        return
     sys = fix["create_system"]()
     try:
         for i in range(5):
-            sys = fix["mutate"](sys)
-            sys = fix["commit"](sys, f"commit {i}")
+            sys = _mutate_commit(fix, sys, f"commit {i}")
         hist = sys.history(limit=2)
         assert len(hist) == 2, "Should return only 2 commits with limit=2"
     finally:
         fix["close"](sys)
 
 
+@_requires("graphable")
 def test_ancestors(fix: Dict[str, Any]) -> None:
     """ancestors returns all ancestor IDs."""
-    if not _has_capability(fix, "graphable"):
-        return
     sys = fix["create_system"]()
     try:
-        sys = fix["mutate"](sys)
-        sys = fix["commit"](sys, "first")
+        sys = _mutate_commit(fix, sys, "first")
         id1 = sys.snapshot_id()
-        sys = fix["mutate"](sys)
-        sys = fix["commit"](sys, "second")
+        sys = _mutate_commit(fix, sys, "second")
         id2 = sys.snapshot_id()
-        sys = fix["mutate"](sys)
-        sys = fix["commit"](sys, "third")
+        sys = _mutate_commit(fix, sys, "third")
         id3 = sys.snapshot_id()
         ancs = set(sys.ancestors(id3))
         assert id2 in ancs, "id2 should be ancestor of id3"
         assert id1 in ancs, "id1 should be ancestor of id3"
+        assert id3 not in ancs, "a snapshot is not its own ancestor"
     finally:
         fix["close"](sys)
 
 
+@_requires("graphable")
 def test_ancestor_predicate(fix: Dict[str, Any]) -> None:
     """is_ancestor checks ancestry relationship."""
-    if not _has_capability(fix, "graphable"):
-        return
     sys = fix["create_system"]()
     try:
-        sys = fix["mutate"](sys)
-        sys = fix["commit"](sys, "first")
+        sys = _mutate_commit(fix, sys, "first")
         id1 = sys.snapshot_id()
-        sys = fix["mutate"](sys)
-        sys = fix["commit"](sys, "second")
+        sys = _mutate_commit(fix, sys, "second")
         id2 = sys.snapshot_id()
         assert sys.is_ancestor(id1, id2) is True, \
             "id1 should be ancestor of id2"
@@ -288,26 +396,20 @@ def test_ancestor_predicate(fix: Dict[str, Any]) -> None:
         fix["close"](sys)
 
 
+@_requires("graphable", "branchable")
 def test_common_ancestor(fix: Dict[str, Any]) -> None:
     """common_ancestor finds merge base of diverged branches."""
-    if not _has_capability(fix, "graphable"):
-        return
-    if not _has_capability(fix, "branchable"):
-        return
     sys = fix["create_system"]()
     try:
-        sys = fix["mutate"](sys)
-        sys = fix["commit"](sys, "common base")
+        sys = _mutate_commit(fix, sys, "common base")
         sys = sys.branch("feature")
         fork_point = sys.snapshot_id()
         # Advance main
-        sys = fix["mutate"](sys)
-        sys = fix["commit"](sys, "main advance")
+        sys = _mutate_commit(fix, sys, "main advance")
         main_id = sys.snapshot_id()
         # Advance feature
         sys = sys.checkout("feature")
-        sys = fix["mutate"](sys)
-        sys = fix["commit"](sys, "feature advance")
+        sys = _mutate_commit(fix, sys, "feature advance")
         feat_id = sys.snapshot_id()
         # Check common ancestor
         ancestor = sys.common_ancestor(main_id, feat_id)
@@ -317,14 +419,12 @@ def test_common_ancestor(fix: Dict[str, Any]) -> None:
         fix["close"](sys)
 
 
+@_requires("graphable")
 def test_commit_info(fix: Dict[str, Any]) -> None:
     """commit_info returns metadata for a specific commit."""
-    if not _has_capability(fix, "graphable"):
-        return
     sys = fix["create_system"]()
     try:
-        sys = fix["mutate"](sys)
-        sys = fix["commit"](sys, "test info")
+        sys = _mutate_commit(fix, sys, "test info")
         sid = sys.snapshot_id()
         # commit_info falls back to snapshot_meta in default impl
         meta = sys.snapshot_meta(sid)
@@ -338,18 +438,15 @@ def test_commit_info(fix: Dict[str, Any]) -> None:
 # Layer 4: Mergeable tests
 # ============================================================
 
+@_requires("mergeable")
 def test_merge(fix: Dict[str, Any]) -> None:
     """merge returns self with merge applied."""
-    if not _has_capability(fix, "mergeable"):
-        return
     sys = fix["create_system"]()
     try:
-        sys = fix["mutate"](sys)
-        sys = fix["commit"](sys, "base")
+        sys = _mutate_commit(fix, sys, "base")
         sys = sys.branch("feature")
         sys = sys.checkout("feature")
-        sys = fix["mutate"](sys)
-        sys = fix["commit"](sys, "feature work")
+        sys = _mutate_commit(fix, sys, "feature work")
         # Merge feature into main
         sys = sys.checkout("main")
         sys = sys.merge("feature")
@@ -360,22 +457,18 @@ def test_merge(fix: Dict[str, Any]) -> None:
         fix["close"](sys)
 
 
+@_requires("mergeable")
 def test_merge_parent_ids(fix: Dict[str, Any]) -> None:
     """Merge commit has two parents."""
-    if not _has_capability(fix, "mergeable"):
-        return
     sys = fix["create_system"]()
     try:
-        sys = fix["mutate"](sys)
-        sys = fix["commit"](sys, "base")
+        sys = _mutate_commit(fix, sys, "base")
         sys = sys.branch("feature")
         # Advance main
-        sys = fix["mutate"](sys)
-        sys = fix["commit"](sys, "main advance")
+        sys = _mutate_commit(fix, sys, "main advance")
         # Advance feature
         sys = sys.checkout("feature")
-        sys = fix["mutate"](sys)
-        sys = fix["commit"](sys, "feature advance")
+        sys = _mutate_commit(fix, sys, "feature advance")
         # Merge from main
         sys = sys.checkout("main")
         sys = sys.merge("feature")
@@ -386,23 +479,19 @@ def test_merge_parent_ids(fix: Dict[str, Any]) -> None:
         fix["close"](sys)
 
 
+@_requires("mergeable")
 def test_conflicts_empty_for_compatible(fix: Dict[str, Any]) -> None:
     """conflicts returns empty for compatible branches."""
-    if not _has_capability(fix, "mergeable"):
-        return
     sys = fix["create_system"]()
     try:
-        sys = fix["mutate"](sys)
-        sys = fix["commit"](sys, "base")
+        sys = _mutate_commit(fix, sys, "base")
         sys = sys.branch("feature")
         # Advance main
-        sys = fix["mutate"](sys)
-        sys = fix["commit"](sys, "main")
+        sys = _mutate_commit(fix, sys, "main")
         main_id = sys.snapshot_id()
         # Advance feature
         sys = sys.checkout("feature")
-        sys = fix["mutate"](sys)
-        sys = fix["commit"](sys, "feature")
+        sys = _mutate_commit(fix, sys, "feature")
         feat_id = sys.snapshot_id()
         conflicts = sys.conflicts(main_id, feat_id)
         assert len(conflicts) == 0, \
@@ -411,17 +500,14 @@ def test_conflicts_empty_for_compatible(fix: Dict[str, Any]) -> None:
         fix["close"](sys)
 
 
+@_requires("mergeable")
 def test_diff(fix: Dict[str, Any]) -> None:
     """diff returns delta between two snapshots."""
-    if not _has_capability(fix, "mergeable"):
-        return
     sys = fix["create_system"]()
     try:
-        sys = fix["mutate"](sys)
-        sys = fix["commit"](sys, "first")
+        sys = _mutate_commit(fix, sys, "first")
         id1 = sys.snapshot_id()
-        sys = fix["mutate"](sys)
-        sys = fix["commit"](sys, "second")
+        sys = _mutate_commit(fix, sys, "second")
         id2 = sys.snapshot_id()
         d = sys.diff(id1, id2)
         assert d is not None, "diff should return non-None"
@@ -433,9 +519,10 @@ def test_diff(fix: Dict[str, Any]) -> None:
 # SystemIdentity tests
 # ============================================================
 
+@_read_only
 def test_system_identity(fix: Dict[str, Any]) -> None:
     """System identity is properly configured."""
-    sys = fix["create_system"]()
+    sys = _acquire(fix)
     try:
         assert isinstance(sys.system_id(), str), \
             "system_id should return a string"
@@ -445,7 +532,7 @@ def test_system_identity(fix: Dict[str, Any]) -> None:
         assert caps is not None, "capabilities should return non-None"
         assert caps.snapshotable is True, "should support snapshotable"
     finally:
-        fix["close"](sys)
+        _release(fix, sys)
 
 
 # ============================================================
@@ -473,8 +560,7 @@ def test_count_after_writes(fix: Dict[str, Any]) -> None:
         sys = fix["write_entry"](sys, "a", "1")
         sys = fix["commit"](sys, "first")
         assert fix["count_entries"](sys) == 1
-        sys = fix["write_entry"](sys, "b", "2")
-        sys = fix["write_entry"](sys, "c", "3")
+        sys = _write_entries(fix, sys, [("b", "2"), ("c", "3")])
         sys = fix["commit"](sys, "second")
         assert fix["count_entries"](sys) == 3
     finally:
@@ -485,9 +571,7 @@ def test_multiple_entries_readable(fix: Dict[str, Any]) -> None:
     """Multiple entries are independently readable."""
     sys = fix["create_system"]()
     try:
-        sys = fix["write_entry"](sys, "x", "val-x")
-        sys = fix["write_entry"](sys, "y", "val-y")
-        sys = fix["write_entry"](sys, "z", "val-z")
+        sys = _write_entries(fix, sys, [("x", "val-x"), ("y", "val-y"), ("z", "val-z")])
         sys = fix["commit"](sys, "three entries")
         assert fix["read_entry"](sys, "x") == "val-x"
         assert fix["read_entry"](sys, "y") == "val-y"
@@ -498,14 +582,11 @@ def test_multiple_entries_readable(fix: Dict[str, Any]) -> None:
         fix["close"](sys)
 
 
+@_requires("branchable")
 def test_branch_data_isolation(fix: Dict[str, Any]) -> None:
     """Data written on one branch is not visible on another."""
-    if not _has_capability(fix, "branchable"):
-        return
-    sys = fix["create_system"]()
+    sys = _create_seeded(fix, (("shared", "base-value"),), "base commit")
     try:
-        sys = fix["write_entry"](sys, "shared", "base-value")
-        sys = fix["commit"](sys, "base commit")
         sys = sys.branch("feature")
         # Write on main
         sys = fix["write_entry"](sys, "main-only", "main-data")
@@ -533,15 +614,12 @@ def test_branch_data_isolation(fix: Dict[str, Any]) -> None:
         fix["close"](sys)
 
 
+@_requires(fixture_keys=("delete_entry",))
 def test_delete_entry_consistency(fix: Dict[str, Any]) -> None:
     """Deleted entry is no longer readable after commit."""
-    if fix.get("delete_entry") is None:
-        return
-    sys = fix["create_system"]()
+    sys = _create_seeded(fix, (("keep", "keep-val"), ("remove", "remove-val")),
+                         "two entries")
     try:
-        sys = fix["write_entry"](sys, "keep", "keep-val")
-        sys = fix["write_entry"](sys, "remove", "remove-val")
-        sys = fix["commit"](sys, "two entries")
         assert fix["count_entries"](sys) == 2
         assert fix["read_entry"](sys, "remove") == "remove-val"
         sys = fix["delete_entry"](sys, "remove")
@@ -556,14 +634,11 @@ def test_delete_entry_consistency(fix: Dict[str, Any]) -> None:
         fix["close"](sys)
 
 
+@_requires(fixture_keys=("delete_entry",))
 def test_overwrite_entry(fix: Dict[str, Any]) -> None:
     """Overwriting an entry updates its value."""
-    if fix.get("delete_entry") is None:
-        return
-    sys = fix["create_system"]()
+    sys = _create_seeded(fix, (("key", "original"),), "original value")
     try:
-        sys = fix["write_entry"](sys, "key", "original")
-        sys = fix["commit"](sys, "original value")
         assert fix["read_entry"](sys, "key") == "original"
         # Overwrite: delete + write
         sys = fix["delete_entry"](sys, "key")
@@ -621,6 +696,10 @@ ALL_TESTS = {
     ],
 }
 
+# ALL_TESTS as (layer, test_fn) pairs, flattened once at import.
+_ALL_TESTS_FLAT: Tuple[Tuple[str, Callable], ...] = tuple(
+    (layer, test_fn) for layer, tests in ALL_TESTS.items() for test_fn in tests)
+
 
 def run_compliance_tests(fixture: Dict[str, Any]) -> None:
     """Run all compliance tests for the given fixture.
@@ -629,12 +708,49 @@ def run_compliance_tests(fixture: Dict[str, Any]) -> None:
         create_system  - () -> system
         mutate         - (system) -> system
         commit         - (system, msg) -> system
+        mutate_commit  - (system, msg) -> system (optional fast path for
+                         mutate followed by commit)
         close          - (system) -> None
         write_entry    - (system, key, value) -> system
+        write_entries  - (system, [(key, value), ...]) -> system (optional bulk
+                         write_entry, e.g. one transaction or one IO batch)
         read_entry     - (system, key) -> value or None
         count_entries  - (system) -> int
         delete_entry   - (system, key) -> system (or None to skip delete tests)
+        create_seeded  - (((key, value), ...), msg) -> system (optional; lets
+                         the fixture memoize common setup prefixes, e.g. by
+                         cloning a prepared system)
+        acquire_pooled - () -> system (optional; with release_pooled, recycles
+        release_pooled - (system) -> None  systems instead of create/close)
+
+    Tests whose capabilities or fixture keys are missing are skipped.
     """
-    for layer, tests in ALL_TESTS.items():
-        for test_fn in tests:
+    for _layer, test_fn in _ALL_TESTS_FLAT:
+        if skip_reason(fixture, test_fn) is None:
             test_fn(fixture)
+
+
+def make_pytest_generate_tests(fixture: Dict[str, Any]) -> Callable[[Any], None]:
+    """Build a pytest hook parametrizing compliance tests over ALL_TESTS.
+
+    Assign the result to `pytest_generate_tests` in an adapter's test
+    module. Any test function taking a `test_fn` argument runs once per
+    compliance test; if it also takes `layer`, that receives the ALL_TESTS
+    key the test belongs to. Tests the fixture can't support are marked
+    skipped at collection time, so no system is built for them.
+    """
+    def pytest_generate_tests(metafunc: Any) -> None:
+        if "test_fn" not in metafunc.fixturenames:
+            return
+        import pytest
+
+        with_layer = "layer" in metafunc.fixturenames
+        params = []
+        for layer, test_fn in _ALL_TESTS_FLAT:
+            reason = skip_reason(fixture, test_fn)
+            marks = [pytest.mark.skip(reason=reason)] if reason else []
+            values = (layer, test_fn) if with_layer else (test_fn,)
+            params.append(pytest.param(*values, id=test_fn.__name__, marks=marks))
+        metafunc.parametrize(("layer", "test_fn") if with_layer else "test_fn", params)
+
+    return pytest_generate_tests
@@ -9,17 +9,35 @@ Six layers, each optional:
     6. Watchable    - state change observation
 
 Execution control:
-    Methods that may perform IO accept an optional `opts` dict.
+    Methods that may perform IO accept an optional `opts` mapping.
     Recognized key: "sync" (bool, default True).
     When sync=True (default), methods block and return direct values.
     When sync=False, methods return awaitables/futures.
+    The default is the shared, read-only DEFAULT_OPTS; implementations
+    must not mutate the opts they receive.
+
+    {"sync": False} is kept for parity with the Clojure protocols; adapters
+    may ignore it. Python callers should use the `<name>_async` companion
+    that every opts-taking method has instead: it always returns a
+    coroutine. The default companion runs the sync method via
+    asyncio.to_thread, so concurrent calls on one system run in parallel
+    worker threads. Adapters that don't override the companions must
+    therefore be safe to call from several threads at once.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Set, Optional, List, Dict, Any, Callable
+from collections import deque
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Set, Optional, List, Dict, Any, Callable, Mapping
 from yggdrasil.types import SnapshotRef, Capabilities, Conflict, Overlay
 
 
+# Default `opts` for every protocol method: one immutable shared instance.
+DEFAULT_OPTS: Mapping[str, Any] = MappingProxyType({"sync": True})
+
+
 # ============================================================
 # System Identity
 # ============================================================
@@ -61,17 +79,25 @@ class Snapshotable(ABC):
         ...
 
     @abstractmethod
-    def as_of(self, snap_id: str, opts: Optional[Dict[str, Any]] = None) -> Any:
+    def as_of(self, snap_id: str, opts: Mapping[str, Any] = DEFAULT_OPTS) -> Any:
         """Read-only view at given snapshot.
         opts: {"sync": True} -- when False, returns awaitable."""
         ...
 
     @abstractmethod
-    def snapshot_meta(self, snap_id: str, opts: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def snapshot_meta(self, snap_id: str, opts: Mapping[str, Any] = DEFAULT_OPTS) -> Dict[str, Any]:
         """Metadata for snapshot. Returns dict with timestamp, author, message, etc.
         opts: {"sync": True} -- when False, returns awaitable."""
         ...
 
+    async def as_of_async(self, snap_id: str) -> Any:
+        """as_of as a coroutine, run in a worker thread."""
+        return await asyncio.to_thread(self.as_of, snap_id)
+
+    async def snapshot_meta_async(self, snap_id: str) -> Dict[str, Any]:
+        """snapshot_meta as a coroutine, run in a worker thread."""
+        return await asyncio.to_thread(self.snapshot_meta, snap_id)
+
 
 # ============================================================
 # Layer 2: Branchable (named references)
@@ -82,7 +108,7 @@ class Branchable(ABC):
     Mutating operations return self (mutated) for method chaining."""
 
     @abstractmethod
-    def branches(self, opts: Optional[Dict[str, Any]] = None) -> Set[str]:
+    def branches(self, opts: Mapping[str, Any] = DEFAULT_OPTS) -> Set[str]:
         """List all branch names.
         opts: {"sync": True} -- when False, returns awaitable."""
         ...
@@ -94,24 +120,40 @@ class Branchable(ABC):
 
     @abstractmethod
     def branch(self, name: str, from_ref: Optional[str] = None,
-               opts: Optional[Dict[str, Any]] = None) -> "Branchable":
+               opts: Mapping[str, Any] = DEFAULT_OPTS) -> "Branchable":
         """Create branch from current state (or from_ref snapshot/branch).
         Returns self with branch created. Current branch unchanged.
         opts: {"sync": True} -- when False, returns awaitable."""
         ...
 
     @abstractmethod
-    def delete_branch(self, name: str, opts: Optional[Dict[str, Any]] = None) -> "Branchable":
+    def delete_branch(self, name: str, opts: Mapping[str, Any] = DEFAULT_OPTS) -> "Branchable":
         """Remove branch. Returns self without the branch.
         opts: {"sync": True} -- when False, returns awaitable."""
         ...
 
     @abstractmethod
-    def checkout(self, name: str, opts: Optional[Dict[str, Any]] = None) -> "Branchable":
+    def checkout(self, name: str, opts: Mapping[str, Any] = DEFAULT_OPTS) -> "Branchable":
         """Switch to branch. Returns self at branch head.
         opts: {"sync": True} -- when False, returns awaitable."""
         ...
 
+    async def branches_async(self) -> Set[str]:
+        """branches as a coroutine, run in a worker thread."""
+        return await asyncio.to_thread(self.branches)
+
+    async def branch_async(self, name: str, from_ref: Optional[str] = None) -> "Branchable":
+        """branch as a coroutine, run in a worker thread."""
+        return await asyncio.to_thread(self.branch, name, from_ref)
+
+    async def delete_branch_async(self, name: str) -> "Branchable":
+        """delete_branch as a coroutine, run in a worker thread."""
+        return await asyncio.to_thread(self.delete_branch, name)
+
+    async def checkout_async(self, name: str) -> "Branchable":
+        """checkout as a coroutine, run in a worker thread."""
+        return await asyncio.to_thread(self.checkout, name)
+
 
 # ============================================================
 # Layer 3: Graphable (history/DAG traversal)
@@ -122,42 +164,85 @@ class Graphable(ABC):
 
     @abstractmethod
     def history(self, limit: Optional[int] = None, since: Optional[str] = None,
-                opts: Optional[Dict[str, Any]] = None) -> List[str]:
+                opts: Mapping[str, Any] = DEFAULT_OPTS) -> List[str]:
         """Commit history as list of snapshot-ids, newest first.
         opts: {"sync": True} -- when False, returns awaitable."""
         ...
 
-    @abstractmethod
-    def ancestors(self, snap_id: str, opts: Optional[Dict[str, Any]] = None) -> List[str]:
-        """All ancestor snapshot-ids of given snapshot.
+    def ancestors(self, snap_id: str, opts: Mapping[str, Any] = DEFAULT_OPTS) -> List[str]:
+        """All ancestor snapshot-ids of given snapshot, excluding snap_id
+        itself, nearest first. Optional -- default walks parent_ids
+        breadth-first.
         opts: {"sync": True} -- when False, returns awaitable."""
-        ...
+        if not _is_snapshotable(type(self)):
+            raise NotImplementedError("ancestors not supported by this system")
+        seen: Set[str] = set()
+        out: List[str] = []
+        queue = deque((snap_id,))
+        while queue:
+            for parent in self.parent_ids(queue.popleft()):
+                if parent not in seen:
+                    seen.add(parent)
+                    out.append(parent)
+                    queue.append(parent)
+        return out
 
     @abstractmethod
-    def is_ancestor(self, a: str, b: str, opts: Optional[Dict[str, Any]] = None) -> bool:
+    def is_ancestor(self, a: str, b: str, opts: Mapping[str, Any] = DEFAULT_OPTS) -> bool:
         """True if snapshot a is an ancestor of snapshot b.
         opts: {"sync": True} -- when False, returns awaitable."""
         ...
 
     @abstractmethod
     def common_ancestor(self, a: str, b: str,
-                        opts: Optional[Dict[str, Any]] = None) -> Optional[str]:
+                        opts: Mapping[str, Any] = DEFAULT_OPTS) -> Optional[str]:
         """Most recent common ancestor. Returns snapshot-id or None.
         opts: {"sync": True} -- when False, returns awaitable."""
         ...
 
-    def commit_graph(self, opts: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def commit_graph(self, opts: Mapping[str, Any] = DEFAULT_OPTS) -> Dict[str, Any]:
         """Full DAG structure. Optional -- default raises NotImplementedError.
         opts: {"sync": True} -- when False, returns awaitable."""
         raise NotImplementedError("commit_graph not supported by this system")
 
-    def commit_info(self, snap_id: str, opts: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def commit_info(self, snap_id: str, opts: Mapping[str, Any] = DEFAULT_OPTS) -> Dict[str, Any]:
         """Metadata for specific commit. Falls back to snapshot_meta.
         opts: {"sync": True} -- when False, returns awaitable."""
-        if isinstance(self, Snapshotable):
+        if _is_snapshotable(type(self)):
             return self.snapshot_meta(snap_id, opts)
         raise NotImplementedError("commit_info not supported by this system")
 
+    async def history_async(self, limit: Optional[int] = None,
+                            since: Optional[str] = None) -> List[str]:
+        """history as a coroutine, run in a worker thread."""
+        return await asyncio.to_thread(self.history, limit, since)
+
+    async def ancestors_async(self, snap_id: str) -> List[str]:
+        """ancestors as a coroutine, run in a worker thread."""
+        return await asyncio.to_thread(self.ancestors, snap_id)
+
+    async def is_ancestor_async(self, a: str, b: str) -> bool:
+        """is_ancestor as a coroutine, run in a worker thread."""
+        return await asyncio.to_thread(self.is_ancestor, a, b)
+
+    async def common_ancestor_async(self, a: str, b: str) -> Optional[str]:
+        """common_ancestor as a coroutine, run in a worker thread."""
+        return await asyncio.to_thread(self.common_ancestor, a, b)
+
+    async def commit_graph_async(self) -> Dict[str, Any]:
+        """commit_graph as a coroutine, run in a worker thread."""
+        return await asyncio.to_thread(self.commit_graph)
+
+    async def commit_info_async(self, snap_id: str) -> Dict[str, Any]:
+        """commit_info as a coroutine, run in a worker thread."""
+        return await asyncio.to_thread(self.commit_info, snap_id)
+
+
+@lru_cache(maxsize=None)
+def _is_snapshotable(cls: type) -> bool:
+    """issubclass(cls, Snapshotable), memoized per class to skip ABC dispatch."""
+    return issubclass(cls, Snapshotable)
+
 
 # ============================================================
 # Layer 4: Mergeable (combine lineages)
@@ -169,24 +254,37 @@ class Mergeable(ABC):
     @abstractmethod
     def merge(self, source: str, strategy: Optional[str] = None,
               message: Optional[str] = None,
-              opts: Optional[Dict[str, Any]] = None) -> "Mergeable":
+              opts: Mapping[str, Any] = DEFAULT_OPTS) -> "Mergeable":
         """Merge source branch/snapshot into current. Returns self with merge applied.
         opts: {"sync": True} -- when False, returns awaitable."""
         ...
 
     @abstractmethod
     def conflicts(self, a: str, b: str,
-                  opts: Optional[Dict[str, Any]] = None) -> List[Conflict]:
+                  opts: Mapping[str, Any] = DEFAULT_OPTS) -> List[Conflict]:
         """Detect conflicts between two snapshots without merging.
         opts: {"sync": True} -- when False, returns awaitable."""
         ...
 
     @abstractmethod
-    def diff(self, a: str, b: str, opts: Optional[Dict[str, Any]] = None) -> Any:
+    def diff(self, a: str, b: str, opts: Mapping[str, Any] = DEFAULT_OPTS) -> Any:
         """Compute delta between two snapshots.
         opts: {"sync": True} -- when False, returns awaitable."""
         ...
 
+    async def merge_async(self, source: str, strategy: Optional[str] = None,
+                          message: Optional[str] = None) -> "Mergeable":
+        """merge as a coroutine, run in a worker thread."""
+        return await asyncio.to_thread(self.merge, source, strategy, message)
+
+    async def conflicts_async(self, a: str, b: str) -> List[Conflict]:
+        """conflicts as a coroutine, run in a worker thread."""
+        return await asyncio.to_thread(self.conflicts, a, b)
+
+    async def diff_async(self, a: str, b: str) -> Any:
+        """diff as a coroutine, run in a worker thread."""
+        return await asyncio.to_thread(self.diff, a, b)
+
 
 # ============================================================
 # Layer 5: Overlayable (live fork - Spindel integration)
@@ -198,21 +296,21 @@ class Overlayable(ABC):
 
     @abstractmethod
     def overlay(self, mode: str = "gated",
-                opts: Optional[Dict[str, Any]] = None) -> Overlay:
+                opts: Mapping[str, Any] = DEFAULT_OPTS) -> Overlay:
         """Create overlay. mode: 'frozen', 'following', 'gated'.
         opts: {"sync": True} -- when False, returns awaitable."""
         ...
 
     @abstractmethod
     def advance(self, overlay: Overlay,
-                opts: Optional[Dict[str, Any]] = None) -> None:
+                opts: Mapping[str, Any] = DEFAULT_OPTS) -> None:
         """Sync overlay to parent's current state (gated mode).
         opts: {"sync": True} -- when False, returns awaitable."""
         ...
 
     @abstractmethod
     def peek_parent(self, overlay: Overlay,
-                    opts: Optional[Dict[str, Any]] = None) -> Any:
+                    opts: Mapping[str, Any] = DEFAULT_OPTS) -> Any:
         """Read parent's current state without advancing.
         opts: {"sync": True} -- when False, returns awaitable."""
         ...
@@ -229,18 +327,38 @@ class Overlayable(ABC):
 
     @abstractmethod
     def merge_down(self, overlay: Overlay,
-                   opts: Optional[Dict[str, Any]] = None) -> None:
+                   opts: Mapping[str, Any] = DEFAULT_OPTS) -> None:
         """Push overlay writes to parent.
         opts: {"sync": True} -- when False, returns awaitable."""
         ...
 
     @abstractmethod
     def discard(self, overlay: Overlay,
-                opts: Optional[Dict[str, Any]] = None) -> None:
+                opts: Mapping[str, Any] = DEFAULT_OPTS) -> None:
         """Abandon overlay and all its isolated writes.
         opts: {"sync": True} -- when False, returns awaitable."""
         ...
 
+    async def overlay_async(self, mode: str = "gated") -> Overlay:
+        """overlay as a coroutine, run in a worker thread."""
+        return await asyncio.to_thread(self.overlay, mode)
+
+    async def advance_async(self, overlay: Overlay) -> None:
+        """advance as a coroutine, run in a worker thread."""
+        return await asyncio.to_thread(self.advance, overlay)
+
+    async def peek_parent_async(self, overlay: Overlay) -> Any:
+        """peek_parent as a coroutine, run in a worker thread."""
+        return await asyncio.to_thread(self.peek_parent, overlay)
+
+    async def merge_down_async(self, overlay: Overlay) -> None:
+        """merge_down as a coroutine, run in a worker thread."""
+        return await asyncio.to_thread(self.merge_down, overlay)
+
+    async def discard_async(self, overlay: Overlay) -> None:
+        """discard as a coroutine, run in a worker thread."""
+        return await asyncio.to_thread(self.discard, overlay)
+
 
 # ============================================================
 # Layer 6: Watchable (state change observation)
@@ -251,7 +369,7 @@ class Watchable(ABC):
 
     @abstractmethod
     def watch(self, callback: Callable[[Dict[str, Any]], None],
-              opts: Optional[Dict[str, Any]] = None) -> str:
+              opts: Mapping[str, Any] = DEFAULT_OPTS) -> str:
         """Register callback for state change events. Returns watch-id string.
         callback receives dicts with keys: type, snapshot_id, branch, timestamp.
         type is one of: 'commit', 'branch_created', 'branch_deleted', 'checkout'.
@@ -259,7 +377,16 @@ class Watchable(ABC):
         ...
 
     @abstractmethod
-    def unwatch(self, watch_id: str, opts: Optional[Dict[str, Any]] = None) -> None:
+    def unwatch(self, watch_id: str, opts: Mapping[str, Any] = DEFAULT_OPTS) -> None:
         """Stop watching. Removes callback and cleans up if last watcher.
         opts: {"sync": True} -- when False, returns awaitable."""
         ...
+
+    async def watch_async(self, callback: Callable[[Dict[str, Any]], None],
+                          opts: Mapping[str, Any] = DEFAULT_OPTS) -> str:
+        """watch as a coroutine, run in a worker thread; opts as for watch."""
+        return await asyncio.to_thread(self.watch, callback, opts)
+
+    async def unwatch_async(self, watch_id: str) -> None:
+        """unwatch as a coroutine, run in a worker thread."""
+        return await asyncio.to_thread(self.unwatch, watch_id)
@@ -4,16 +4,24 @@ Mirrors the Clojure types in src/yggdrasil/types.cljc.
 All types are immutable dataclasses for safety and hashability.
 """
 
-from dataclasses import dataclass, field
-from typing import Set, Optional, Dict, Any
-import time
+from dataclasses import dataclass
+from typing import Set, Optional, Dict, Any, Iterable, List
+import sys
+from time import time_ns as _time_ns
+
+# dataclass(slots=True) needs Python 3.10; older versions keep a __dict__.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 # ============================================================
 # HLC - Hybrid Logical Clock
 # ============================================================
 
-@dataclass(frozen=True, order=True)
+# Bits reserved for the logical counter in a packed HLC.
+_LOGICAL_BITS = 20
+
+
+@dataclass(frozen=True, order=True, **_SLOTS)
 class HLC:
     """Hybrid Logical Clock for causal ordering without synchronized clocks.
 
@@ -22,21 +30,41 @@ class HLC:
     physical: int  # milliseconds since epoch
     logical: int = 0  # counter for same-ms events
 
+    @classmethod
+    def pack(cls, physical: int, logical: int = 0) -> int:
+        """Pack into one int whose ordering matches HLC ordering.
+
+        Lets hot loops compare and hash plain ints; logical must be < 2**20.
+        """
+        if not 0 <= logical < (1 << _LOGICAL_BITS):
+            raise ValueError(f"logical counter out of range: {logical}")
+        return (physical << _LOGICAL_BITS) | logical
+
+    @classmethod
+    def unpack(cls, packed: int) -> "HLC":
+        """Inverse of pack."""
+        return cls(physical=packed >> _LOGICAL_BITS,
+                   logical=packed & ((1 << _LOGICAL_BITS) - 1))
+
+    def packed(self) -> int:
+        """This HLC as a packed int (see pack)."""
+        return HLC.pack(self.physical, self.logical)
+
     @classmethod
     def now(cls) -> "HLC":
         """Create HLC from current time."""
-        return cls(physical=int(time.time() * 1000), logical=0)
+        return cls(physical=_time_ns() // 1_000_000, logical=0)
 
     def tick(self) -> "HLC":
         """Advance HLC for local event."""
-        now_ms = int(time.time() * 1000)
+        now_ms = _time_ns() // 1_000_000
         if now_ms > self.physical:
             return HLC(physical=now_ms, logical=0)
         return HLC(physical=self.physical, logical=self.logical + 1)
 
     def receive(self, remote: "HLC") -> "HLC":
         """Update HLC on receiving message with remote HLC."""
-        now_ms = int(time.time() * 1000)
+        now_ms = _time_ns() // 1_000_000
         max_physical = max(now_ms, self.physical, remote.physical)
 
         if max_physical == self.physical == remote.physical:
@@ -49,6 +77,18 @@ class HLC:
         else:
             return HLC(physical=max_physical, logical=0)
 
+    @classmethod
+    def from_arrays(cls, physical: Iterable[int], logical: Iterable[int]) -> List["HLC"]:
+        """Build HLCs from parallel physical/logical columns.
+
+        Accepts any iterables of ints, including NumPy integer arrays, for
+        bulk import of clocks kept in columnar form.
+        """
+        physical, logical = list(physical), list(logical)
+        if len(physical) != len(logical):
+            raise ValueError("physical and logical must have the same length")
+        return [cls(int(p), int(l)) for p, l in zip(physical, logical)]
+
     def to_json(self) -> Dict[str, int]:
         return {"physical": self.physical, "logical": self.logical}
 
@@ -61,7 +101,7 @@ class HLC:
 # SnapshotRef - universal reference to a point-in-time
 # ============================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class SnapshotRef:
     """Universal reference to a point-in-time snapshot.
 
@@ -69,10 +109,18 @@ class SnapshotRef:
     """
     system_id: str  # which system instance
     snapshot_id: str  # UUID or content-hash (native format)
-    parent_ids: frozenset = field(default_factory=frozenset)  # ancestry
+    parent_ids: tuple = ()  # ancestry, sorted; see parent_set()
     hlc: Optional[HLC] = None  # causal timestamp
     content_hash: Optional[str] = None  # for verification/dedup
 
+    def __post_init__(self) -> None:
+        # any iterable of ids in, sorted tuple stored: equal refs hash equal
+        object.__setattr__(self, "parent_ids", tuple(sorted(self.parent_ids)))
+
+    def parent_set(self) -> frozenset:
+        """parent_ids with set semantics."""
+        return frozenset(self.parent_ids)
+
     def to_json(self) -> Dict[str, Any]:
         return {
             "system-id": self.system_id,
@@ -87,7 +135,7 @@ class SnapshotRef:
         return cls(
             system_id=data["system-id"],
             snapshot_id=data["snapshot-id"],
-            parent_ids=frozenset(data.get("parent-ids", [])),
+            parent_ids=data.get("parent-ids", ()),
             hlc=HLC.from_json(data["hlc"]) if data.get("hlc") else None,
             content_hash=data.get("content-hash"),
         )
@@ -97,7 +145,15 @@ class SnapshotRef:
 # Capabilities
 # ============================================================
 
-@dataclass(frozen=True)
+# Capabilities.to_json templates, copied on return; at most 2**6 keys.
+_CAPS_JSON: Dict["Capabilities", Dict[str, bool]] = {}
+
+# Capabilities JSON keys, in field order.
+_CAP_KEYS = ("snapshotable", "branchable", "graphable",
+             "mergeable", "overlayable", "watchable")
+
+
+@dataclass(frozen=True, **_SLOTS)
 class Capabilities:
     """Advertises which protocol layers a system supports."""
     snapshotable: bool = False
@@ -108,25 +164,29 @@ class Capabilities:
     watchable: bool = False
 
     def to_json(self) -> Dict[str, bool]:
-        return {
-            "snapshotable": self.snapshotable,
-            "branchable": self.branchable,
-            "graphable": self.graphable,
-            "mergeable": self.mergeable,
-            "overlayable": self.overlayable,
-            "watchable": self.watchable,
-        }
+        """JSON form: a fresh copy of the per-value template dict."""
+        cached = _CAPS_JSON.get(self)
+        if cached is None:
+            cached = _CAPS_JSON[self] = {
+                "snapshotable": self.snapshotable,
+                "branchable": self.branchable,
+                "graphable": self.graphable,
+                "mergeable": self.mergeable,
+                "overlayable": self.overlayable,
+                "watchable": self.watchable,
+            }
+        return dict(cached)
 
     @classmethod
     def from_json(cls, data: Dict[str, bool]) -> "Capabilities":
-        return cls(**data)
+        return cls(*[data.get(key, False) for key in _CAP_KEYS])
 
 
 # ============================================================
 # Overlay - live fork state
 # ============================================================
 
-@dataclass
+@dataclass(**_SLOTS)
 class Overlay:
     """Live fork state for Overlayable systems.
 
@@ -155,7 +215,7 @@ class Overlay:
 # Conflict descriptor
 # ============================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class Conflict:
     """Describes a conflict between two snapshots during merge.
 